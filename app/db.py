@@ -1,8 +1,10 @@
 import os
+import asyncio
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from typing import List, Dict, Optional
 import logging
+from functools import lru_cache
 
 # Load environment variables
 load_dotenv()
@@ -51,8 +53,10 @@ async def store_news(news_data: List[Dict], category: str = "general") -> Dict:
             }
             articles_to_insert.append(article_data)
         
-        # Insert into Supabase
-        response = supabase.table("news_articles").insert(articles_to_insert).execute()
+        # Insert into Supabase; the client is blocking, so run it in a worker
+        # thread to let concurrent callers overlap their round-trips
+        insert_query = supabase.table("news_articles").insert(articles_to_insert)
+        response = await asyncio.get_running_loop().run_in_executor(None, insert_query.execute)
         
         logger.info(f"Successfully stored {len(articles_to_insert)} articles in category '{category}'")
         return {
@@ -281,6 +285,7 @@ async def cleanup_old_articles(days_old: int = 30) -> Dict:
             "deleted_count": 0
         }
 
+@lru_cache(maxsize=256)
 def map_source_to_final_category(source_category: str) -> str:
     """Map a complex source category to a single, final category for Supabase"""
     
@@ -403,12 +403,22 @@ async def step2_extract_and_summarize_playwright(categories: List[str], data_dir
     
     # Check if Playwright is available
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api
     except ImportError:
         logger.error("❌ Playwright not installed. Install with: pip install playwright && playwright install chromium")
         logger.error("❌ Playwright not available. Please install with: pip install playwright && playwright install chromium")
         return False
     
+    from scripts.generate_inshorts_playwright import (
+        build_output_data,
+        close_browser,
+        close_http_client,
+        get_browser,
+        load_news_data,
+        process_news_data_playwright,
+        save_to_json,
+    )
+    
     # Filter categories that have input files
     valid_categories = []
     for category in categories:
@@ -429,53 +439,38 @@ async def step2_extract_and_summarize_playwright(categories: List[str], data_dir
     
     success_count = 0
     
-    # Use Playwright to process all categories with a single browser instance
-    async with async_playwright() as p:
-        # Launch browser with optimized settings
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-extensions",
-                "--disable-popup-blocking",
-                "--disable-notifications",
-                "--disable-plugins",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding"
-            ]
-        )
-        
-        logger.info("🚀 Playwright browser launched, processing categories...")
-        
-        try:
-            for i, (source_category, final_category, input_file) in enumerate(valid_categories):
-                logger.info(f"\n📰 Processing category {i+1}/{len(valid_categories)}: {source_category}")
-                
-                output_file = os.path.join(data_dir, f"inshorts_{final_category}.json")
-                
-                # Create the Playwright extraction script command
-                cmd = [
-                    sys.executable, "scripts/generate_inshorts_playwright.py",
-                    "--input", input_file,
-                    "--output", output_file,
-                    "--max-articles", str(max_articles),
-                    "--timeout", str(timeout)
-                ]
-                
-                if headless:
-                    cmd.append("--headless")
-                
-                if run_command(cmd, f"Processing {source_category} articles with Playwright (mapped to {final_category})"):
-                    success_count += 1
-                
-                # Optimized: Reduced delay between categories
-                if i < len(valid_categories) - 1:
-                    await asyncio.sleep(0.2)  # Reduced from 0.5 to 0.2
-        
-        finally:
-            await browser.close()
+    # Process all categories in-process so they share a single browser instance
+    # instead of paying interpreter + Chromium startup per category
+    await get_browser(headless)
+    logger.info("🚀 Playwright browser launched, processing categories...")
+    
+    try:
+        for i, (source_category, final_category, input_file) in enumerate(valid_categories):
+            logger.info(f"\n📰 Processing category {i+1}/{len(valid_categories)}: {source_category}")
+            
+            output_file = os.path.join(data_dir, f"inshorts_{final_category}.json")
+            
+            description = f"Processing {source_category} articles with Playwright (mapped to {final_category})"
+            logger.info(f"🔄 {description}")
+            try:
+                news_data = load_news_data(input_file)
+                processed_articles = await process_news_data_playwright(
+                    news_data, max_articles, timeout, headless
+                )
+                save_to_json(build_output_data(input_file, processed_articles), output_file)
+                logger.info(f"✅ {description} - SUCCESS")
+                success_count += 1
+            except Exception as e:
+                logger.error(f"❌ {description} - FAILED")
+                logger.error(f"Error: {e}")
+            
+            # Optimized: Reduced delay between categories
+            if i < len(valid_categories) - 1:
+                await asyncio.sleep(0.2)  # Reduced from 0.5 to 0.2
+    
+    finally:
+        await close_http_client()
+        await close_browser()
     
     logger.info(f"\n📊 Step 2 Summary: {success_count}/{len(valid_categories)} categories processed successfully")
     logger.info("🎭 Playwright processing completed!")
@@ -697,4 +692,6 @@ async def main():
         return 1
 
 if __name__ == "__main__":
+    from scripts.generate_inshorts_playwright import install_fast_event_loop
+    install_fast_event_loop()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
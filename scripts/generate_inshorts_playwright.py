@@ -12,11 +12,33 @@ import sys
 import time
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
 import traceback
 import re
 import hashlib
 import threading
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    from lxml import etree, html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    # lxml/cssselect are optional here; without them selectors are run inside the browser
+    etree = lxml_html = CSSSelector = None
+
+try:
+    import httpx
+except ImportError:
+    # Without httpx every article goes through the browser
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    # Output files are written with the stdlib json module instead
+    orjson = None
 
 # Add the parent directory to sys.path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -30,6 +52,80 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Chromium flags tuned for scraping: skip GPU, sync, translate and other
+# background services that only add startup time and memory per browser
+BROWSER_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-translate",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-popup-blocking",
+    "--disable-notifications",
+    "--disable-plugins",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    "--disable-breakpad",
+    "--disable-component-update",
+    "--disable-field-trial-config",
+    "--dns-prefetch-disable",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-blink-features=AutomationControlled",
+    "--no-first-run"
+]
+
+# Resource types never needed for extraction: <img> attributes are read from
+# the DOM, so the image bytes themselves don't have to be downloaded.
+# Stylesheets still load: innerText (titles, live-page fallbacks) skips
+# display:none nodes only when the CSS that hides them is applied
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Ad and analytics hosts (subdomains included) aborted for every page
+_TRACKER_HOSTS = frozenset({
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+    'googletagmanager.com', 'googletagservices.com', 'google-analytics.com',
+    'amazon-adsystem.com', 'scorecardresearch.com', 'facebook.net',
+    'taboola.com', 'outbrain.com', 'chartbeat.com', 'quantserve.com'
+})
+
+# Upper bounds for event-driven waits (these replaced fixed 2s/3s sleeps)
+CONTENT_WAIT_TIMEOUT_MS = 2000
+GNEWS_REDIRECT_TIMEOUT_MS = 5000
+
+# Articles processed at the same time, each on its own BrowserContext
+DEFAULT_CONCURRENCY = 5
+
+# Seconds added to an article's navigation timeouts before it is abandoned
+ARTICLE_TIME_LIMIT_SLACK_S = 15
+
+# Extracted-details cache (--cache-dir): entries expire after a day, and
+# bumping the version invalidates them whenever extraction logic changes
+ARTICLE_CACHE_TTL_S = 24 * 60 * 60
+ARTICLE_CACHE_VERSION = 1
+
+# Static-HTML fast path: pages whose server-rendered HTML already carries an
+# image, a title and this much article text skip the browser entirely
+STATIC_MIN_CONTENT_LENGTH = 300
+STATIC_FETCH_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+BROWSER_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 720},
+    "java_script_enabled": True,
+    "bypass_csp": True,
+    "ignore_https_errors": True
+}
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Generate Inshorts-style news summaries using Playwright")
@@ -67,65 +163,354 @@ def parse_args():
         help="Timeout in seconds for each article"
     )
     
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of articles processed at the same time"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for caching extracted article details between runs (disabled if not set)"
+    )
+    
     
     return parser.parse_args()
 
 def load_news_data(file_path: str) -> Dict:
     """Load news data from a JSON file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logger.info(f"Successfully loaded news data from {file_path}")
         return data
     except Exception as e:
         logger.error(f"Error loading news data from {file_path}: {e}")
         raise
 
+# Non-article hosts (social media, video, shopping); subdomains are matched too
+_EXCLUDED_HOSTS = frozenset({
+    'google.com', 'youtube.com', 'facebook.com', 'twitter.com', 'instagram.com',
+    'linkedin.com', 'pinterest.com', 'reddit.com', 'tiktok.com', 'ebay.com'
+})
+_AD_HOST_RE = re.compile(r'(?:^|\.)(?:ads|doubleclick|googleadservices|googlesyndication)\.')
+# Google on any country domain (google.co.in, support.google.com.au, ...)
+_GOOGLE_HOST_RE = re.compile(r'(?:^|\.)google\.(?:com?\.)?[a-z]{2,3}$')
+_PRODUCT_PAGE_RE = re.compile(r'amazon\.com/(?:dp|gp)/')
+
+# URL path fragments that usually indicate an article
+_NEWS_INDICATOR_RE = re.compile(r'/article/|/news/|/story/|/post/|/blog/|\.htm|/20|/article-|/news-')
+
+_NEWS_HOSTS = frozenset({
+    'cnn.com', 'bbc.com', 'reuters.com', 'ap.org', 'npr.org',
+    'nytimes.com', 'washingtonpost.com', 'wsj.com', 'bloomberg.com',
+    'guardian.com', 'independent.co.uk', 'telegraph.co.uk',
+    'timesofindia.com', 'hindustantimes.com', 'indianexpress.com',
+    'ndtv.com', 'news18.com', 'zeenews.com', 'deccanherald.com'
+})
+
+def _host_in(host: str, domains: frozenset) -> bool:
+    """Check whether a host or any of its parent domains is in the given set"""
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in domains for i in range(len(parts) - 1))
+
+@lru_cache(maxsize=4096)
+def _is_excluded_host(host: str) -> bool:
+    """Check whether a host is social media, video, shopping or ads (cached, candidate links share few hosts)"""
+    return _host_in(host, _EXCLUDED_HOSTS) or bool(_AD_HOST_RE.search(host) or _GOOGLE_HOST_RE.search(host))
+
+@lru_cache(maxsize=4096)
+def _is_news_host(host: str) -> bool:
+    """Check whether a host belongs to a known news site (cached)"""
+    return _host_in(host, _NEWS_HOSTS)
+
 def _is_valid_article_url(url: str) -> bool:
     """Check if URL is a valid article URL (not social media, ads, etc.)"""
     if not url or not url.startswith(('http://', 'https://')):
         return False
     
     # Exclude common non-article domains
-    excluded_domains = [
-        'google.com', 'youtube.com', 'facebook.com', 'twitter.com', 'instagram.com',
-        'linkedin.com', 'pinterest.com', 'reddit.com', 'tiktok.com',
-        'ads.', 'doubleclick.', 'googleadservices.', 'googlesyndication.',
-        'amazon.com/dp/', 'amazon.com/gp/', 'ebay.com'
-    ]
-    
+    try:
+        host = _site_host(url)
+    except ValueError:
+        # Unparseable href (e.g. a broken IPv6 host); move on to the next candidate
+        return False
     url_lower = url.lower()
-    for domain in excluded_domains:
-        if domain in url_lower:
-            return False
-    
-    # Must contain common news indicators
-    news_indicators = [
-        '/article/', '/news/', '/story/', '/post/', '/blog/', 
-        '.html', '.htm', '/20', '/article-', '/news-'
-    ]
+    if _is_excluded_host(host) or _PRODUCT_PAGE_RE.search(url_lower):
+        return False
     
     # If it has news indicators, it's likely valid
-    for indicator in news_indicators:
-        if indicator in url_lower:
-            return True
+    if _NEWS_INDICATOR_RE.search(url_lower):
+        return True
     
     # If it's from a known news domain, it's probably valid
-    news_domains = [
-        'cnn.com', 'bbc.com', 'reuters.com', 'ap.org', 'npr.org',
-        'nytimes.com', 'washingtonpost.com', 'wsj.com', 'bloomberg.com',
-        'guardian.com', 'independent.co.uk', 'telegraph.co.uk',
-        'timesofindia.com', 'hindustantimes.com', 'indianexpress.com',
-        'ndtv.com', 'news18.com', 'zeenews.com', 'deccanherald.com'
-    ]
-    
-    for domain in news_domains:
-        if domain in url_lower:
-            return True
+    if _is_news_host(host):
+        return True
     
     # Default: if it's not obviously bad, allow it
     return len(url) > 20 and '/' in url[10:]
 
+# Link selectors tried (in order) on a Google News page that did not auto-redirect
+_GNEWS_LINK_SELECTORS = (
+    "a[href*='http']:not([href*='google.com']):not([href*='youtube.com'])",
+    "article a",
+    "[data-n-tid] a",
+    "h3 a",
+    "h4 a",
+    ".article a",
+    ".story a",
+    "[role='article'] a"
+)
+_GNEWS_LINK_SELECTORS_JOINED = ", ".join(_GNEWS_LINK_SELECTORS)
+
+# Returns up to 15 candidate hrefs per selector. Links _is_valid_article_url
+# would reject anyway (relative, Google or YouTube hosts) are dropped in the
+# browser so they neither cross the wire nor use up the 15 slots
+_GNEWS_LINK_HREFS_JS = r"""(elements, selectors) => {
+    const isCandidate = href => {
+        if (!href || !/^https?:\/\//.test(href)) return false;
+        try {
+            const host = new URL(href).hostname.replace(/^www\./, '');
+            return !/(^|\.)(google|youtube)\.com$/.test(host);
+        } catch (e) {
+            return false;
+        }
+    };
+    const links = elements.map(e => [e, e.getAttribute('href')]).filter(([, href]) => isCandidate(href));
+    return selectors.map(selector =>
+        links.filter(([e]) => e.matches(selector)).slice(0, 15).map(([, href]) => href)
+    );
+}"""
+
+# Generic article container selectors, tried after any site-specific ones
+_ARTICLE_SELECTORS = (
+    "article",
+    "[role='main']",
+    ".article-content",
+    ".story-content",
+    ".post-content",
+    ".entry-content",
+    ".content-body",
+    ".article-body",
+    ".story-body",
+    ".main-content",
+    "#article-content",
+    "#story-content",
+    ".news-content",
+    ".article-text",
+    ".story-text",
+    ".content-text",
+    ".post-body",
+    ".entry-body",
+    ".article-wrapper",
+    ".story-wrapper",
+    ".content-wrapper",
+    ".text-content",
+    ".article-detail",
+    ".story-detail",
+    ".news-body",
+    ".article-main",
+    ".story-main",
+    ".content-main",
+    "#content",
+    "#main-content",
+    "#article",
+    "#story",
+    ".full-story",
+    ".article-full",
+    ".story-full"
+)
+_ARTICLE_SELECTORS_JOINED = ", ".join(_ARTICLE_SELECTORS)
+
+# Returns the inner text of the first element matching each selector, given all
+# elements matched by the selectors joined into one group (document order)
+_FIRST_MATCH_TEXTS_JS = """(elements, selectors) => selectors.map(selector => {
+    const element = elements.find(e => e.matches(selector));
+    return element ? element.innerText : null;
+})"""
+
+# Secondary container selectors, used as an extra content source
+_DIV_SELECTORS = (
+    ".story", ".article", ".content", ".post", ".entry",
+    "#story", "#article", "#content", "#post", "#entry",
+    ".news-article", ".article-container", ".story-container",
+    ".content-container", ".post-container", ".entry-container"
+)
+_DIV_SELECTORS_JOINED = ", ".join(_DIV_SELECTORS)
+
+# Generic headline selectors, tried after the page's h1 elements
+_GENERIC_TITLE_SELECTORS = (
+    "article h1",
+    ".article-title",
+    ".headline",
+    ".story-title",
+    ".post-title",
+    "[data-testid*='headline']",
+    "[class*='headline']"
+)
+_GENERIC_TITLE_SELECTORS_JOINED = ", ".join(_GENERIC_TITLE_SELECTORS)
+
+_META_DESCRIPTION_SELECTORS = (
+    ("description", "meta[name='description']"),
+    ("og_description", "meta[property='og:description']")
+)
+
+_META_DESCRIPTIONS_JS = """() => {
+    const content = selector => {
+        const element = document.querySelector(selector);
+        return element ? element.getAttribute('content') : null;
+    };
+    return {
+        description: content("meta[name='description']"),
+        og_description: content("meta[property='og:description']")
+    };
+}"""
+
+# Social-card images, the document title and raw attributes of the first 30
+# <img> tags, collected in one evaluation instead of a round-trip per attribute.
+# The <img> scan is skipped when a social-card image already wins.
+_PAGE_MEDIA_JS = """() => {
+    const content = selector => {
+        const element = document.querySelector(selector);
+        return element ? element.getAttribute('content') : null;
+    };
+    const og_image = content("meta[property='og:image']");
+    const twitter_image = content("meta[name='twitter:image']");
+    return {
+        og_image: og_image,
+        twitter_image: twitter_image,
+        title: document.title,
+        images: (og_image || twitter_image) ? [] : Array.from(document.querySelectorAll('img')).slice(0, 30).map(img => ({
+            src: img.getAttribute('src'),
+            alt: img.getAttribute('alt'),
+            width: img.getAttribute('width'),
+            height: img.getAttribute('height')
+        }))
+    };
+}"""
+
+# Returned by select_title when no source yields a usable title
+NO_TITLE_FOUND = "No Title Found"
+
+# Raw inputs for every title strategy: h1 texts with their parent's class,
+# first-match texts for the generic headline selectors, og:title and JSON-LD
+_TITLE_SOURCES_JS = """({group, selectors}) => {
+    const selectorMatches = Array.from(document.querySelectorAll(group));
+    const ogTitle = document.querySelector("meta[property='og:title']");
+    return {
+        h1s: Array.from(document.querySelectorAll('h1')).map(h1 => ({
+            text: h1.innerText,
+            parent_class: (h1.parentElement && h1.parentElement.getAttribute('class')) || ''
+        })),
+        selector_titles: selectors.map(selector => {
+            const element = selectorMatches.find(e => e.matches(selector));
+            return element ? element.innerText : null;
+        }),
+        og_title: ogTitle ? ogTitle.getAttribute('content') : null,
+        json_ld: Array.from(document.querySelectorAll("script[type='application/ld+json']")).map(s => s.textContent)
+    };
+}"""
+
+async def _query_first_match_texts(page, selector_group: str, selectors: List[str]) -> List[Optional[str]]:
+    """Get the text of the first match for each selector with a single DOM query"""
+    return await page.eval_on_selector_all(selector_group, _FIRST_MATCH_TEXTS_JS, selectors)
+
+# Elements whose text innerText would end with a line break
+_BLOCK_TAGS = (
+    "p", "div", "br", "li", "section", "article", "header", "footer",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "tr"
+)
+
+def _prepare_page_tree(tree):
+    """Approximate innerText on a parsed tree: drop non-visible text and break lines after blocks"""
+    etree.strip_elements(tree, "script", "style", "noscript", "template", with_tail=False)
+    for element in tree.iter(*_BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+    
+    return tree
+
+async def _load_page_tree(page):
+    """
+    Fetch the rendered DOM once and parse it in-process with lxml.
+    
+    Returns None when lxml is unavailable or the page cannot be parsed, in
+    which case callers query the live page instead. A _StaticPage hands back
+    the tree it was built from rather than parsing its HTML again.
+    """
+    if CSSSelector is None:
+        return None
+    
+    if isinstance(page, _StaticPage):
+        return page.tree
+    
+    try:
+        tree = lxml_html.fromstring(await page.content())
+    except Exception as e:
+        logger.debug(f"Could not parse page HTML locally: {e}")
+        return None
+    
+    return _prepare_page_tree(tree)
+
+# CSS selectors translated to XPath once and reused for every page
+_COMPILED_SELECTORS: Dict[str, "CSSSelector"] = {}
+
+def _css_matcher(selector: str):
+    """Get the compiled matcher for a CSS selector, compiling it on first use"""
+    matcher = _COMPILED_SELECTORS.get(selector)
+    if matcher is None:
+        matcher = _COMPILED_SELECTORS[selector] = CSSSelector(selector)
+    return matcher
+
+def _precompile_selectors(selectors) -> None:
+    """Compile selectors ahead of time, skipping any lxml cannot translate"""
+    if CSSSelector is None:
+        return
+    for selector in selectors:
+        try:
+            _css_matcher(selector)
+        except Exception as e:
+            logger.debug(f"Cannot compile selector {selector}: {e}")
+
+def _tree_first_match_texts(tree, selectors: List[str]) -> List[Optional[str]]:
+    """Get the text of the first match for each selector from a parsed tree"""
+    texts = []
+    for selector in selectors:
+        try:
+            matches = _css_matcher(selector)(tree)
+        except Exception:
+            matches = []
+        texts.append(matches[0].text_content() if matches else None)
+    return texts
+
+async def _first_match_texts(page, tree, selector_group: str, selectors: List[str]) -> List[Optional[str]]:
+    """Get first-match texts from the parsed tree, or from the live page without one"""
+    if tree is not None:
+        return _tree_first_match_texts(tree, selectors)
+    return await _query_first_match_texts(page, selector_group, selectors)
+
+async def _paragraph_texts(page, tree) -> List[str]:
+    """Get the text of every <p> element on the page"""
+    if tree is not None:
+        return [paragraph.text_content() for paragraph in tree.iter("p")]
+    return await page.eval_on_selector_all("p", "elements => elements.map(e => e.innerText)")
+
+async def _meta_descriptions(page, tree) -> Dict:
+    """Get the meta description and og:description contents"""
+    if tree is None:
+        return await page.evaluate(_META_DESCRIPTIONS_JS)
+    
+    descriptions = {}
+    for key, selector in _META_DESCRIPTION_SELECTORS:
+        matches = _css_matcher(selector)(tree)
+        descriptions[key] = matches[0].get("content") if matches else None
+    return descriptions
+
 async def extract_clean_article_content(page) -> str:
     """
     Extract clean article content from the page, filtering out navigation, ads, and boilerplate.
@@ -136,92 +521,62 @@ async def extract_clean_article_content(page) -> str:
         content_candidates = []
         
         # Strategy 1: Try to find article content using semantic selectors (expanded list)
-        article_selectors = [
-            "article",
-            "[role='main']",
-            ".article-content",
-            ".story-content", 
-            ".post-content",
-            ".entry-content",
-            ".content-body",
-            ".article-body",
-            ".story-body",
-            ".main-content",
-            "#article-content",
-            "#story-content",
-            ".news-content",
-            ".article-text",
-            ".story-text",
-            ".content-text",
-            ".post-body",
-            ".entry-body",
-            ".article-wrapper",
-            ".story-wrapper",
-            ".content-wrapper",
-            ".text-content",
-            ".article-detail",
-            ".story-detail",
-            ".news-body",
-            ".article-main",
-            ".story-main",
-            ".content-main",
-            "#content",
-            "#main-content",
-            "#article",
-            "#story",
-            ".full-story",
-            ".article-full",
-            ".story-full"
-        ]
+        article_selectors = list(_ARTICLE_SELECTORS)
+        selector_group = _ARTICLE_SELECTORS_JOINED
         
         # Add site-specific selectors based on current URL
         current_url = page.url.lower()
         site_specific_selectors = get_site_specific_selectors(current_url)
         if site_specific_selectors:
             article_selectors = site_specific_selectors + article_selectors
+            selector_group = get_site_specific_selectors_joined(current_url) + ", " + selector_group
             logger.info(f"🎯 Using site-specific selectors for: {current_url}")
         
+        # Parse the rendered HTML once and run every strategy's selectors in-process
+        tree = await _load_page_tree(page)
+        
+        # Query all semantic selectors at once instead of one round-trip per selector
+        try:
+            selector_texts = await _first_match_texts(page, tree, selector_group, article_selectors)
+        except Exception as e:
+            logger.debug(f"Semantic selector query failed: {e}")
+            selector_texts = []
+        
         # Extract content from semantic selectors with quality scoring
-        for selector in article_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.inner_text()
-                    if content and len(content.strip()) > 500:  # Increased threshold from 200 to 500
-                        cleaned_content = _clean_content(content.strip())
-                        if len(cleaned_content) > 300:  # Ensure cleaned content is substantial
-                            content_candidates.append({
-                                'content': cleaned_content,
-                                'source': f"semantic_selector_{selector}",
-                                'length': len(cleaned_content)
-                            })
-                            logger.info(f"✅ Found article content using selector: {selector} ({len(cleaned_content)} chars)")
-            except:
-                continue
+        for selector, content in zip(article_selectors, selector_texts):
+            if content and len(content.strip()) > 500:  # Increased threshold from 200 to 500
+                cleaned_content = _clean_content(content.strip())
+                if len(cleaned_content) > 300:  # Ensure cleaned content is substantial
+                    content_candidates.append({
+                        'content': cleaned_content,
+                        'source': f"semantic_selector_{selector}",
+                        'length': len(cleaned_content)
+                    })
+                    logger.info(f"✅ Found article content using selector: {selector} ({len(cleaned_content)} chars)")
         
         # Strategy 2: Extract meaningful paragraphs (enhanced) - Try this BEFORE meta descriptions
         try:
-            paragraphs = await page.query_selector_all("p")
+            paragraphs = await _paragraph_texts(page, tree)
             meaningful_paragraphs = []
             
-            for p in paragraphs:
-                p_text = await p.inner_text()
-                p_text = p_text.strip()
-                
-                # Enhanced filtering for better content
-                skip_words = [
-                    'subscribe', 'sign in', 'newsletter', 'follow us', 'share this',
-                    'advertisement', 'sponsored', 'cookie', 'privacy policy',
-                    'terms of service', 'read more', 'click here', 'related articles',
-                    'also read', 'trending now', 'breaking news', 'live updates',
-                    'watch video', 'photo gallery', 'you may like', 'recommended',
-                    'sponsored content', 'latest news', 'more news', 'top stories',
-                    'view all', 'see more', 'load more', 'show more', 'continue reading'
-                ]
+            # Enhanced filtering for better content
+            skip_words = [
+                'subscribe', 'sign in', 'newsletter', 'follow us', 'share this',
+                'advertisement', 'sponsored', 'cookie', 'privacy policy',
+                'terms of service', 'read more', 'click here', 'related articles',
+                'also read', 'trending now', 'breaking news', 'live updates',
+                'watch video', 'photo gallery', 'you may like', 'recommended',
+                'sponsored content', 'latest news', 'more news', 'top stories',
+                'view all', 'see more', 'load more', 'show more', 'continue reading'
+            ]
+            
+            for p_text in paragraphs:
+                p_text = (p_text or "").strip()
+                p_text_lower = p_text.lower()
                 
                 # More comprehensive filtering
                 if (len(p_text) > 50 and  # Increased from 40 to 50
-                    not any(skip_word in p_text.lower() for skip_word in skip_words) and
+                    not any(skip_word in p_text_lower for skip_word in skip_words) and
                     not p_text.isupper() and  # Skip all-caps navigation
                     not re.match(r'^[A-Z\s]+$', p_text) and  # Skip navigation menus
                     not re.match(r'^[0-9\s\-\|\:]+$', p_text) and  # Skip date/time strings
@@ -251,61 +606,48 @@ async def extract_clean_article_content(page) -> str:
         
         # Strategy 3: Try alternative div selectors for more content
         try:
-            div_selectors = [
-                ".story", ".article", ".content", ".post", ".entry",
-                "#story", "#article", "#content", "#post", "#entry",
-                ".news-article", ".article-container", ".story-container",
-                ".content-container", ".post-container", ".entry-container"
-            ]
+            div_texts = await _first_match_texts(page, tree, _DIV_SELECTORS_JOINED, list(_DIV_SELECTORS))
             
-            for selector in div_selectors:
-                element = await page.query_selector(selector)
-                if element:
-                    div_content = await element.inner_text()
-                    if div_content and len(div_content.strip()) > 400:  # Increased threshold
-                        cleaned_div_content = _clean_content(div_content.strip())
-                        if len(cleaned_div_content) > 250:
-                            content_candidates.append({
-                                'content': cleaned_div_content,
-                                'source': f"div_selector_{selector}",
-                                'length': len(cleaned_div_content)
-                            })
-                            logger.info(f"✅ Found content using div selector {selector} ({len(cleaned_div_content)} chars)")
+            for selector, div_content in zip(_DIV_SELECTORS, div_texts):
+                if div_content and len(div_content.strip()) > 400:  # Increased threshold
+                    cleaned_div_content = _clean_content(div_content.strip())
+                    if len(cleaned_div_content) > 250:
+                        content_candidates.append({
+                            'content': cleaned_div_content,
+                            'source': f"div_selector_{selector}",
+                            'length': len(cleaned_div_content)
+                        })
+                        logger.info(f"✅ Found content using div selector {selector} ({len(cleaned_div_content)} chars)")
         except:
             pass
         
-        # Strategy 4: Meta descriptions (LOWER PRIORITY - only if no substantial content found)
+        # Strategies 4 and 5 read both description meta tags in one evaluation
         try:
-            # Try meta description
-            desc_element = await page.query_selector("meta[name='description']")
-            if desc_element:
-                meta_desc = await desc_element.get_attribute("content")
-                if meta_desc and len(meta_desc.strip()) > 100:  # Increased threshold from 50 to 100
-                    cleaned_meta_desc = _clean_content(meta_desc.strip())
-                    content_candidates.append({
-                        'content': cleaned_meta_desc,
-                        'source': "meta_description",
-                        'length': len(cleaned_meta_desc)
-                    })
-                    logger.info(f"✅ Found meta description ({len(cleaned_meta_desc)} chars)")
+            meta_descriptions = await _meta_descriptions(page, tree)
         except:
-            pass
+            meta_descriptions = {}
+        
+        # Strategy 4: Meta descriptions (LOWER PRIORITY - only if no substantial content found)
+        meta_desc = meta_descriptions.get('description')
+        if meta_desc and len(meta_desc.strip()) > 100:  # Increased threshold from 50 to 100
+            cleaned_meta_desc = _clean_content(meta_desc.strip())
+            content_candidates.append({
+                'content': cleaned_meta_desc,
+                'source': "meta_description",
+                'length': len(cleaned_meta_desc)
+            })
+            logger.info(f"✅ Found meta description ({len(cleaned_meta_desc)} chars)")
         
         # Strategy 5: Open Graph description (LOWEST PRIORITY)
-        try:
-            og_desc_element = await page.query_selector("meta[property='og:description']")
-            if og_desc_element:
-                og_desc = await og_desc_element.get_attribute("content")
-                if og_desc and len(og_desc.strip()) > 100:  # Increased threshold from 50 to 100
-                    cleaned_og_desc = _clean_content(og_desc.strip())
-                    content_candidates.append({
-                        'content': cleaned_og_desc,
-                        'source': "og_description",
-                        'length': len(cleaned_og_desc)
-                    })
-                    logger.info(f"✅ Found OG description ({len(cleaned_og_desc)} chars)")
-        except:
-            pass
+        og_desc = meta_descriptions.get('og_description')
+        if og_desc and len(og_desc.strip()) > 100:  # Increased threshold from 50 to 100
+            cleaned_og_desc = _clean_content(og_desc.strip())
+            content_candidates.append({
+                'content': cleaned_og_desc,
+                'source': "og_description",
+                'length': len(cleaned_og_desc)
+            })
+            logger.info(f"✅ Found OG description ({len(cleaned_og_desc)} chars)")
         
         # Select the best content based on length
         if content_candidates:
@@ -382,6 +724,38 @@ def _clean_content(content: str) -> str:
 
 # Content quality calculation removed - no longer needed
 
+# Website UI/metadata sentences filtered out of key points - EXPANDED LIST,
+# compiled into one alternation so each sentence is scanned once
+_KEY_POINT_UI_RE = re.compile("|".join(map(re.escape, (
+    'show quick read', 'ai-generated', 'newsroom-reviewed', 'did our ai',
+    'switch to beeps', 'read time:', 'share twitter', 'whatsapp facebook',
+    'reported by:', 'published on', 'last updated', 'subscribe', 'newsletter',
+    'follow us', 'click here', 'read more', 'view full article', 'continue reading',
+    'related articles', 'trending now', 'breaking news updates', 'live updates',
+    'photo gallery', 'watch video', 'also read', 'you may like', 'recommended',
+    # Website navigation and headers
+    'epaper', 'bizzbuzz', 'hmtv live', 'hans app', 'latest news', 'menu',
+    'trending :', 'home >', 'entertainment', 'photo stories', 'sports',
+    'editorial', 'technology', 'lifestyle', 'education & careers', 'business',
+    'hyderabad', 'cricket', 'delhi region', 'karnataka', 'telangana',
+    'andhra pradesh', 'visakhapatnam', 'festival of democracy',
+    # Social media and sharing
+    'email article', 'print article', 'telegram', 'click here to join',
+    'stay updated', 'more stories', 'advertisement', 'advertise with us',
+    # Website footer and legal
+    'terms & conditions', 'privacy policy', 'disclaimer', 'sitemap',
+    'all rights reserved', 'powered by', 'contact us', 'about us',
+    'subscriber terms', 'company', 'media house limited',
+    # Navigation breadcrumbs
+    'news > state >', 'home > news >', 'state > karnataka >',
+    # Author and timestamp patterns
+    'news service |', 'am ist', 'pm ist', 'representational image'
+))))
+
+# Sentences that look like timestamps or publication metadata
+_KEY_POINT_TIMESTAMP_RE = re.compile(r'.*\d{4}\s+\d{1,2}:\d{2}\s+(am|pm)')
+_KEY_POINT_PUBLICATION_RE = re.compile(r'.*(published|updated|reported).*\d{4}')
+
 def generate_key_points(description: str, title: str = "") -> List[str]:
     """
     Generate key points from article description in the specified format
@@ -398,43 +772,16 @@ def generate_key_points(description: str, title: str = "") -> List[str]:
         sentences = re.split(r'[.!?]+', text)
         sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
         
-        # Filter out website UI/metadata sentences - EXPANDED LIST
-        ui_patterns = [
-            'show quick read', 'ai-generated', 'newsroom-reviewed', 'did our ai',
-            'switch to beeps', 'read time:', 'share twitter', 'whatsapp facebook',
-            'reported by:', 'published on', 'last updated', 'subscribe', 'newsletter',
-            'follow us', 'click here', 'read more', 'view full article', 'continue reading',
-            'related articles', 'trending now', 'breaking news updates', 'live updates',
-            'photo gallery', 'watch video', 'also read', 'you may like', 'recommended',
-            # Website navigation and headers
-            'epaper', 'bizzbuzz', 'hmtv live', 'hans app', 'latest news', 'menu',
-            'trending :', 'home >', 'entertainment', 'photo stories', 'sports',
-            'editorial', 'technology', 'lifestyle', 'education & careers', 'business',
-            'hyderabad', 'cricket', 'delhi region', 'karnataka', 'telangana',
-            'andhra pradesh', 'visakhapatnam', 'festival of democracy',
-            # Social media and sharing
-            'email article', 'print article', 'telegram', 'click here to join',
-            'stay updated', 'more stories', 'advertisement', 'advertise with us',
-            # Website footer and legal
-            'terms & conditions', 'privacy policy', 'disclaimer', 'sitemap',
-            'all rights reserved', 'powered by', 'contact us', 'about us',
-            'subscriber terms', 'company', 'media house limited',
-            # Navigation breadcrumbs
-            'news > state >', 'home > news >', 'state > karnataka >',
-            # Author and timestamp patterns
-            'news service |', 'am ist', 'pm ist', 'representational image'
-        ]
-        
         # Filter sentences that contain UI patterns
         filtered_sentences = []
         for sentence in sentences:
             sentence_lower = sentence.lower()
-            is_ui_text = any(pattern in sentence_lower for pattern in ui_patterns)
+            is_ui_text = _KEY_POINT_UI_RE.search(sentence_lower) is not None
             
             # Also filter sentences that look like timestamps or metadata
             if (not is_ui_text and 
-                not re.match(r'.*\d{4}\s+\d{1,2}:\d{2}\s+(am|pm)', sentence_lower) and  # timestamps
-                not re.match(r'.*(published|updated|reported).*\d{4}', sentence_lower) and  # publication info
+                not _KEY_POINT_TIMESTAMP_RE.match(sentence_lower) and  # timestamps
+                not _KEY_POINT_PUBLICATION_RE.match(sentence_lower) and  # publication info
                 not sentence_lower.startswith(('share ', 'follow ', 'subscribe '))):  # social media
                 filtered_sentences.append(sentence)
         
@@ -445,23 +792,6 @@ def generate_key_points(description: str, title: str = "") -> List[str]:
         
         key_points = []
         
-        # Extract key entities and topics for categorization
-        def extract_key_entities(sentence):
-            # Look for proper nouns, organizations, locations, numbers
-            entities = []
-            words = sentence.split()
-            
-            for i, word in enumerate(words):
-                # Capitalized words (likely proper nouns)
-                if word[0].isupper() and len(word) > 2:
-                    entities.append(word)
-                # Numbers with context
-                if re.search(r'\d+', word):
-                    context = ' '.join(words[max(0, i-2):i+3])
-                    entities.append(context.strip())
-            
-            return entities
-        
         # Categorize sentences based on content patterns
         for i, sentence in enumerate(sentences[:5]):  # Limit to 5 key points
             if len(sentence) < 30:
@@ -506,939 +836,672 @@ def validate_content_relevance(content: str, title: str) -> bool:
     # At least 30% of title terms should appear in content
     return matching_terms >= len(title_terms) * 0.3
 
-def is_duplicate_content(content: str, existing_articles: List[Dict]) -> bool:
-    """Check if content is too similar to already processed articles"""
-    content_hash = hashlib.md5(content[:200].encode()).hexdigest()
-    return any(article.get('content_hash') == content_hash for article in existing_articles)
+def compute_content_hash(content: str) -> str:
+    """
+    Fingerprint the opening of an article's content for duplicate detection.
+    
+    Only compared within a run, so it uses BLAKE2b rather than MD5.
+    """
+    return hashlib.blake2b(content[:200].encode(), digest_size=16).hexdigest()
 
-async def extract_clean_title(page, page_title: str) -> str:
+def _tree_title_sources(tree, json_ld: List[str]) -> Dict:
     """
-    Extract article title with better filtering and prioritization
+    Collect the _TITLE_SOURCES_JS inputs from a tree prepared by _prepare_page_tree.
+    
+    JSON-LD blocks are passed in separately because preparing the tree
+    strips <script> elements.
     """
-    try:
-        # Strategy 1: Get h1 elements with smart filtering
-        h1_elements = await page.query_selector_all("h1")
-        candidates = []
+    og_title = _css_matcher("meta[property='og:title']")(tree)
+    return {
+        'h1s': [{
+            'text': h1.text_content(),
+            'parent_class': (h1.getparent().get('class') if h1.getparent() is not None else None) or ''
+        } for h1 in tree.iter('h1')],
+        'selector_titles': _tree_first_match_texts(tree, list(_GENERIC_TITLE_SELECTORS)),
+        'og_title': og_title[0].get('content') if og_title else None,
+        'json_ld': json_ld
+    }
+
+def select_title(title_sources: Dict, page_title: str) -> str:
+    """
+    Pick the article title from the collected title sources.
+    
+    Tries filtered h1s (preferring ones inside article/content containers),
+    headline selectors, og:title, JSON-LD and finally the cleaned page title.
+    Returns NO_TITLE_FOUND when none of them is usable.
+    """
+    # Strategy 1: Get h1 elements with smart filtering
+    candidates = []
+    
+    # Common generic words to deprioritize (but not exclude completely)
+    generic_words = _GENERIC_TITLE_WORDS
+    
+    # Words that indicate this is likely NOT the main title
+    exclude_words = _TITLE_EXCLUDE_WORDS
+    
+    for h1 in title_sources.get('h1s', []):
+        title_text = h1['text']
+        if not title_text or len(title_text.strip()) <= 5:
+            continue
+            
+        title_text = title_text.strip()
+        title_lower = title_text.lower()
         
-        # Common generic words to deprioritize (but not exclude completely)
-        generic_words = {'video', 'videos', 'news', 'breaking', 'latest', 'live', 'watch', 'photos', 'gallery'}
+        # Skip obvious navigation/UI elements
+        if any(word in title_lower for word in exclude_words):
+            continue
         
-        # Words that indicate this is likely NOT the main title
-        exclude_words = {'menu', 'home', 'search', 'navigation', 'subscribe', 'login', 'sign'}
+        # Check if it's in main content area (better context)
+        parent_class = h1['parent_class'].lower()
         
-        for h1 in h1_elements:
-            try:
-                title_text = await h1.inner_text()
-                if not title_text or len(title_text.strip()) <= 5:
-                    continue
-                    
-                title_text = title_text.strip()
-                title_lower = title_text.lower()
-                
-                # Skip obvious navigation/UI elements
-                if any(word in title_lower for word in exclude_words):
-                    continue
-                
-                # Check if it's in main content area (better context)
-                parent_element = await h1.query_selector("xpath=..")
-                parent_class = ""
-                if parent_element:
-                    parent_class = (await parent_element.get_attribute("class") or "").lower()
-                
-                # Simple validation system
-                word_count = len(title_text.split())
-                
-                # Skip generic single words
-                if title_lower in generic_words:
-                    continue
-                
-                # Skip very short single-word titles
-                if len(title_text) < 15 and word_count == 1:
-                    continue
-                
-                # Prefer titles in article/content areas
-                in_content_area = any(keyword in parent_class for keyword in ['article', 'content', 'story', 'headline', 'main'])
-                
-                candidates.append({
-                    'text': title_text,
-                    'length': len(title_text),
-                    'word_count': word_count,
-                    'in_content_area': in_content_area
-                })
-                
-            except:
-                continue
+        # Simple validation system
+        word_count = len(title_text.split())
         
-        # Sort by content area preference, then by length and word count
-        candidates.sort(key=lambda x: (x['in_content_area'], x['word_count'], x['length']), reverse=True)
-        
-        if candidates:
-            best_title = candidates[0]['text']
-            logger.info(f"✅ Using best h1 title: {best_title}")
-            return clean_title_suffix(best_title)
-        
-        # Strategy 2: Try article-specific selectors
-        article_selectors = [
-            "article h1",
-            ".article-title",
-            ".headline",
-            ".story-title",
-            ".post-title",
-            "[data-testid*='headline']",
-            "[class*='headline']"
-        ]
+        # Skip generic single words
+        if title_lower in generic_words:
+            continue
         
-        for selector in article_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    title_text = await element.inner_text()
-                    if title_text and len(title_text.strip()) > 5:
-                        title_text = title_text.strip()
-                        if title_text.lower() not in generic_words:
-                            logger.info(f"✅ Using article selector title: {title_text}")
-                            return clean_title_suffix(title_text)
-            except:
-                continue
+        # Skip very short single-word titles
+        if len(title_text) < 15 and word_count == 1:
+            continue
         
-        # Strategy 3: Try Open Graph title (but validate it's not generic)
-        try:
-            og_element = await page.query_selector("meta[property='og:title']")
-            if og_element:
-                og_title = await og_element.get_attribute("content")
-                if og_title and len(og_title.strip()) > 5:
-                    og_title = og_title.strip()
-                    # Don't use if it's just a generic word
-                    if og_title.lower() not in generic_words and len(og_title.split()) >= 2:
-                        logger.info(f"✅ Using OG title: {og_title}")
-                        return clean_title_suffix(og_title)
-        except:
-            pass
+        # Prefer titles in article/content areas
+        in_content_area = any(keyword in parent_class for keyword in ['article', 'content', 'story', 'headline', 'main'])
         
-        # Strategy 4: Try JSON-LD structured data
+        candidates.append({
+            'text': title_text,
+            'length': len(title_text),
+            'word_count': word_count,
+            'in_content_area': in_content_area
+        })
+    
+    # Sort by content area preference, then by length and word count
+    candidates.sort(key=lambda x: (x['in_content_area'], x['word_count'], x['length']), reverse=True)
+    
+    if candidates:
+        best_title = candidates[0]['text']
+        logger.info(f"✅ Using best h1 title: {best_title}")
+        return clean_title_suffix(best_title)
+    
+    # Strategy 2: Try article-specific selectors
+    for title_text in title_sources.get('selector_titles', []):
+        if title_text and len(title_text.strip()) > 5:
+            title_text = title_text.strip()
+            if title_text.lower() not in generic_words:
+                logger.info(f"✅ Using article selector title: {title_text}")
+                return clean_title_suffix(title_text)
+    
+    # Strategy 3: Try Open Graph title (but validate it's not generic)
+    og_title = title_sources.get('og_title')
+    if og_title and len(og_title.strip()) > 5:
+        og_title = og_title.strip()
+        # Don't use if it's just a generic word
+        if og_title.lower() not in generic_words and len(og_title.split()) >= 2:
+            logger.info(f"✅ Using OG title: {og_title}")
+            return clean_title_suffix(og_title)
+    
+    # Strategy 4: Try JSON-LD structured data
+    for content in title_sources.get('json_ld', []):
         try:
-            json_ld_scripts = await page.query_selector_all("script[type='application/ld+json']")
-            for script in json_ld_scripts:
-                try:
-                    content = await script.inner_text()
-                    import json
-                    data = json.loads(content)
-                    
-                    # Handle both single objects and arrays
-                    items = data if isinstance(data, list) else [data]
-                    
-                    for item in items:
-                        if isinstance(item, dict):
-                            # Look for article or news article
-                            if item.get('@type') in ['Article', 'NewsArticle']:
-                                headline = item.get('headline')
-                                if headline and len(headline.strip()) > 5:
-                                    headline = headline.strip()
-                                    if headline.lower() not in generic_words:
-                                        logger.info(f"✅ Using JSON-LD headline: {headline}")
-                                        return clean_title_suffix(headline)
-                except:
-                    continue
+            data = json.loads(content)
+            
+            # Handle both single objects and arrays
+            items = data if isinstance(data, list) else [data]
+            
+            for item in items:
+                if isinstance(item, dict):
+                    # Look for article or news article
+                    if item.get('@type') in ['Article', 'NewsArticle']:
+                        headline = item.get('headline')
+                        if headline and len(headline.strip()) > 5:
+                            headline = headline.strip()
+                            if headline.lower() not in generic_words:
+                                logger.info(f"✅ Using JSON-LD headline: {headline}")
+                                return clean_title_suffix(headline)
         except:
-            pass
+            continue
+    
+    # Strategy 5: Use page title as last resort (but clean it)
+    if page_title and len(page_title.strip()) > 5:
+        page_title = strip_page_title_suffix(page_title.strip())
         
-        # Strategy 5: Use page title as last resort (but clean it)
-        if page_title and len(page_title.strip()) > 5:
-            page_title = page_title.strip()
-            # Remove common suffixes from page titles
-            suffixes_to_remove = [' - NDTV', ' | NDTV', ' - News', ' | News', ' - Latest News']
-            for suffix in suffixes_to_remove:
-                if page_title.endswith(suffix):
-                    page_title = page_title[:-len(suffix)].strip()
-                    break
-            
-            if page_title.lower() not in generic_words:
-                logger.info(f"✅ Using cleaned page title: {page_title}")
-                return clean_title_suffix(page_title)
+        if page_title.lower() not in generic_words:
+            logger.info(f"✅ Using cleaned page title: {page_title}")
+            return clean_title_suffix(page_title)
+    
+    return NO_TITLE_FOUND
+
+async def extract_clean_title(page, page_title: str) -> str:
+    """
+    Extract article title with better filtering and prioritization
+    """
+    try:
+        # Every title source (h1s, headline selectors, og:title, JSON-LD) in one round-trip
+        try:
+            title_sources = await page.evaluate(
+                _TITLE_SOURCES_JS,
+                {"group": _GENERIC_TITLE_SELECTORS_JOINED, "selectors": list(_GENERIC_TITLE_SELECTORS)}
+            )
+        except Exception as e:
+            logger.debug(f"Title source query failed: {e}")
+            title_sources = {}
         
-        return "No Title Found"
+        return select_title(title_sources, page_title)
         
     except Exception as e:
         logger.error(f"Error extracting title: {e}")
         return page_title or "Error Extracting Title"
 
-def get_site_specific_selectors(url: str) -> List[str]:
-    """Get site-specific content selectors based on the URL"""
-    selectors = []
-    
+# Site-specific selectors keyed by domain; looked up by hostname suffix so
+# subdomains (e.g. sports.ndtv.com) resolve to their parent site.
+# Most sites end with one of a few generic fallback tails, shared below.
+_ARTICLE_BODY_TAIL = ("#article-content", ".story-content", ".article-body")
+_MAIN_CONTENT_TAIL = (".article-content", "#story-content", ".main-content")
+_POST_CONTENT_TAIL = ("#article-content", ".story-content", ".post-content")
+_STORY_MAIN_TAIL = ("#article-content", ".story-content", ".main-content")
+_ARTICLE_MAIN_TAIL = ("#article-content", ".article-body", ".main-content")
+
+_ARTICLE_HEADLINE_TAIL = (".headline", ".article-headline")
+_MAIN_TITLE_TAIL = (".headline", ".main-title")
+_STORY_HEADLINE_TAIL = (".headline", ".story-headline")
+_POST_TITLE_TAIL = (".headline", ".post-title")
+_ARTICLE_TITLE_TAIL = (".headline", ".article-title")
+
+# Both site tables stay as source literals rather than an external data file:
+# the compiled .pyc marshals them, so import costs no parsing, and they are
+# frozen below so the lru_cached lookups can never go stale.
+_CONTENT_SELECTORS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
     # Indian News Sites
-    if "hindustantimes.com" in url:
-        selectors.extend([
-            ".storyDetails",
-            "#main-content", 
-            ".detail",
-            ".story-element-text",
-            ".htImport",
-            ".story-details"
-        ])
-    elif "timesofindia.indiatimes.com" in url:
-        selectors.extend([
-            ".contentwrapper",
-            ".MvyrO",
-            ".awuxh",
-            ".HTz_b", 
-            "._3WlLe",
-            ".Normal",
-            ".ga-headlines",
-            "._1_Akb",
-            ".story_content",
-            "#artext",
-            "[data-articlebody]",
-            ".article-content",
-            ".story-body"
-        ])
-    elif "indianexpress.com" in url:
-        selectors.extend([
-            ".story_details",
-            ".full-details",
-            "#pcl-full-content",
-            ".ie-first-publish",
-            ".story-element"
-        ])
-    elif "ndtv.com" in url:
-        selectors.extend([
-            ".sp-cn",
-            ".story__content",
-            ".ins_storybody",
-            "#ins_storybody",
-            ".content_text"
-        ])
-    elif "news18.com" in url:
-        selectors.extend([
-            ".article-box",
-            ".story-article-box",
-            ".story_content_div",
-            ".article_content"
-        ])
-    elif "zeenews.india.com" in url:
-        selectors.extend([
-            ".article-box",
-            ".story-text",
-            "#story-text",
-            ".article_content"
-        ])
-    elif "deccanherald.com" in url:
-        selectors.extend([
-            ".story-element-text",
-            ".article-content",
-            ".story-content",
-            "#article-content"
-        ])
-    elif "thehindu.com" in url:
-        selectors.extend([
-            ".article-body",
-            ".story-content",
-            "#content-body-14269002",
-            ".story-element"
-        ])
-    elif "economictimes.indiatimes.com" in url:
-        selectors.extend([
-            ".artText",
-            ".Normal",
-            "#pageContent",
-            ".story_content"
-        ])
-    elif "livemint.com" in url:
-        selectors.extend([
-            ".FirstEle",
-            ".paywall",
-            ".story-element",
-            "#container"
-        ])
-    elif "businesstoday.in" in url:
-        selectors.extend([
-            ".story-kicker",
-            ".story-content",
-            ".article-content",
-            "#story-content"
-        ])
-    elif "financialexpress.com" in url:
-        selectors.extend([
-            ".main-story",
-            ".story-content",
-            ".article-content",
-            "#article-content"
-        ])
-    elif "moneycontrol.com" in url:
-        selectors.extend([
-            ".content_wrapper",
-            ".arti-flow",
-            "#article-main",
-            ".article-wrap"
-        ])
-    elif "business-standard.com" in url:
-        selectors.extend([
-            ".story-content-new",
-            ".story-element-text",
-            "#story-content",
-            ".article-content"
-        ])
-    elif "scroll.in" in url:
-        selectors.extend([
-            ".story-element",
-            ".story-content",
-            "#story-content-body",
-            ".article-content"
-        ])
-    elif "thewire.in" in url:
-        selectors.extend([
-            ".td-post-content",
-            ".story-content",
-            "#story-content",
-            ".article-content"
-        ])
-    elif "newslaundry.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".post-content"
-        ])
-    elif "caravanmagazine.in" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-body",
-            "#article-content",
-            ".post-content"
-        ])
-    elif "outlookindia.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    elif "india.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#article-content",
-            ".main-content"
-        ])
-    elif "firstpost.com" in url:
-        selectors.extend([
-            ".story-element",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    elif "news.abplive.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    elif "aajtak.in" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    elif "republicworld.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    elif "timesnownews.com" in url:
-        selectors.extend([
-            ".story-content",
-            ".article-content",
-            "#story-content",
-            ".main-content"
-        ])
-    
+    "hindustantimes.com": (
+        ".storyDetails",
+        "#main-content",
+        ".detail",
+        ".story-element-text",
+        ".htImport",
+        ".story-details"
+    ),
+    "timesofindia.indiatimes.com": (
+        ".contentwrapper",
+        ".MvyrO",
+        ".awuxh",
+        ".HTz_b",
+        "._3WlLe",
+        ".Normal",
+        ".ga-headlines",
+        "._1_Akb",
+        ".story_content",
+        "#artext",
+        "[data-articlebody]",
+        ".article-content",
+        ".story-body"
+    ),
+    "indianexpress.com": (
+        ".story_details",
+        ".full-details",
+        "#pcl-full-content",
+        ".ie-first-publish",
+        ".story-element"
+    ),
+    "ndtv.com": (
+        ".sp-cn",
+        ".story__content",
+        ".ins_storybody",
+        "#ins_storybody",
+        ".content_text"
+    ),
+    "news18.com": (
+        ".article-box",
+        ".story-article-box",
+        ".story_content_div",
+        ".article_content"
+    ),
+    "zeenews.india.com": (
+        ".article-box",
+        ".story-text",
+        "#story-text",
+        ".article_content"
+    ),
+    "deccanherald.com": (
+        ".story-element-text",
+        ".article-content",
+        ".story-content",
+        "#article-content"
+    ),
+    "thehindu.com": (
+        ".article-body",
+        ".story-content",
+        "#content-body-14269002",
+        ".story-element"
+    ),
+    "economictimes.indiatimes.com": (
+        ".artText",
+        ".Normal",
+        "#pageContent",
+        ".story_content"
+    ),
+    "livemint.com": (
+        ".FirstEle",
+        ".paywall",
+        ".story-element",
+        "#container"
+    ),
+    "businesstoday.in": (
+        ".story-kicker",
+        ".story-content",
+        ".article-content",
+        "#story-content"
+    ),
+    "financialexpress.com": (
+        ".main-story",
+        ".story-content",
+        ".article-content",
+        "#article-content"
+    ),
+    "moneycontrol.com": (
+        ".content_wrapper",
+        ".arti-flow",
+        "#article-main",
+        ".article-wrap"
+    ),
+    "business-standard.com": (
+        ".story-content-new",
+        ".story-element-text",
+        "#story-content",
+        ".article-content"
+    ),
+    "scroll.in": (
+        ".story-element",
+        ".story-content",
+        "#story-content-body",
+        ".article-content"
+    ),
+    "thewire.in": (
+        ".td-post-content",
+        ".story-content",
+        "#story-content",
+        ".article-content"
+    ),
+    "newslaundry.com": (
+        ".story-content",
+        ".article-content",
+        "#story-content",
+        ".post-content"
+    ),
+    "caravanmagazine.in": (
+        ".story-content",
+        ".article-body",
+        "#article-content",
+        ".post-content"
+    ),
+    "outlookindia.com": (".story-content",) + _MAIN_CONTENT_TAIL,
+    "india.com": (
+        ".story-content",
+        ".article-content",
+        "#article-content",
+        ".main-content"
+    ),
+    "firstpost.com": (".story-element",) + _MAIN_CONTENT_TAIL,
+    "news.abplive.com": (".story-content",) + _MAIN_CONTENT_TAIL,
+    "aajtak.in": (".story-content",) + _MAIN_CONTENT_TAIL,
+    "republicworld.com": (".story-content",) + _MAIN_CONTENT_TAIL,
+    "timesnownews.com": (".story-content",) + _MAIN_CONTENT_TAIL,
+
     # International News Sites
-    elif "cnn.com" in url:
-        selectors.extend([
-            ".zn-body__paragraph",
-            ".el__leafmedia--sourced-paragraph",
-            ".zn-body__read-all",
-            ".pg-rail-tall__head"
-        ])
-    elif "bbc.com" in url or "bbc.co.uk" in url:
-        selectors.extend([
-            "[data-component='text-block']",
-            ".story-body__inner",
-            ".gel-body-copy",
-            "#story-body"
-        ])
-    elif "reuters.com" in url:
-        selectors.extend([
-            "[data-testid='paragraph']",
-            ".StandardArticleBody_body",
-            ".ArticleBodyWrapper",
-            ".PaywallBarrier-container"
-        ])
-    elif "nytimes.com" in url:
-        selectors.extend([
-            ".StoryBodyCompanionColumn",
-            "[name='articleBody']",
-            ".css-53u6y8",
-            ".story-content"
-        ])
-    elif "washingtonpost.com" in url:
-        selectors.extend([
-            ".article-body",
-            "[data-qa='article-body']",
-            ".paywall",
-            "#article-body"
-        ])
-    elif "wsj.com" in url:
-        selectors.extend([
-            ".wsj-snippet-body",
-            ".article-content",
-            "#articleBody",
-            ".snippet-promotion"
-        ])
-    elif "bloomberg.com" in url:
-        selectors.extend([
-            "[data-module='ArticleBody']",
-            ".body-content",
-            ".fence-body",
-            "#article-content-body"
-        ])
-    elif "guardian.com" in url or "theguardian.com" in url:
-        selectors.extend([
-            ".article-body-commercial-selector",
-            ".content__article-body",
-            "#maincontent",
-            ".prose"
-        ])
-    elif "independent.co.uk" in url:
-        selectors.extend([
-            ".sc-1tw117-0",
-            "#main",
-            ".body-content",
-            ".article-body"
-        ])
-    elif "telegraph.co.uk" in url:
-        selectors.extend([
-            ".article-body-text",
-            "#article-body",
-            ".story-body",
-            ".article-content"
-        ])
-    elif "ap.org" in url or "apnews.com" in url:
-        selectors.extend([
-            ".Article",
-            "[data-key='article']",
-            ".story-content",
-            "#article-content"
-        ])
-    elif "npr.org" in url:
-        selectors.extend([
-            "#storytext",
-            ".storytext",
-            ".story-content",
-            "#article-content"
-        ])
-    elif "foxnews.com" in url:
-        selectors.extend([
-            ".article-body",
-            ".article-text",
-            "#article-content",
-            ".story-content"
-        ])
-    elif "nbcnews.com" in url:
-        selectors.extend([
-            "[data-module='ArticleBody']",
-            ".articleBody",
-            "#article-content",
-            ".story-content"
-        ])
-    elif "cbsnews.com" in url:
-        selectors.extend([
-            ".content__body",
-            "#article-wrap",
-            ".story-content",
-            "#article-content"
-        ])
-    elif "abcnews.go.com" in url:
-        selectors.extend([
-            ".Article__Content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "usatoday.com" in url:
-        selectors.extend([
-            ".story-body",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "politico.com" in url:
-        selectors.extend([
-            ".story-text",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "huffpost.com" in url or "huffingtonpost.com" in url:
-        selectors.extend([
-            ".entry__text",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "axios.com" in url:
-        selectors.extend([
-            ".gtm-story-text",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "vox.com" in url:
-        selectors.extend([
-            ".c-entry-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "buzzfeednews.com" in url:
-        selectors.extend([
-            ".news-article-header__body",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "vice.com" in url:
-        selectors.extend([
-            ".article__body",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "slate.com" in url:
-        selectors.extend([
-            ".article__content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "theatlantic.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".c-article-body"
-        ])
-    elif "newyorker.com" in url:
-        selectors.extend([
-            ".SectionBreak",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "time.com" in url:
-        selectors.extend([
-            ".padded",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "newsweek.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".main-article"
-        ])
-    elif "fortune.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "forbes.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".body-container"
-        ])
-    elif "businessinsider.com" in url:
-        selectors.extend([
-            ".content-lock-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "techcrunch.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".entry-content"
-        ])
-    elif "theverge.com" in url:
-        selectors.extend([
-            ".c-entry-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "wired.com" in url:
-        selectors.extend([
-            ".article__chunks",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "arstechnica.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".post-content"
-        ])
-    elif "engadget.com" in url:
-        selectors.extend([
-            ".article-text",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "gizmodo.com" in url:
-        selectors.extend([
-            ".post-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "mashable.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "venturebeat.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".post-content"
-        ])
-    elif "zdnet.com" in url:
-        selectors.extend([
-            ".storyBody",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "cnet.com" in url:
-        selectors.extend([
-            ".article-main-body",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "9to5mac.com" in url or "9to5google.com" in url:
-        selectors.extend([
-            ".post-content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "macrumors.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".post-content"
-        ])
-    elif "androidcentral.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".post-content"
-        ])
-    elif "imore.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".post-content"
-        ])
-    
+    "cnn.com": (
+        ".zn-body__paragraph",
+        ".el__leafmedia--sourced-paragraph",
+        ".zn-body__read-all",
+        ".pg-rail-tall__head"
+    ),
+    "bbc.com": (
+        "[data-component='text-block']",
+        ".story-body__inner",
+        ".gel-body-copy",
+        "#story-body"
+    ),
+    "bbc.co.uk": (
+        "[data-component='text-block']",
+        ".story-body__inner",
+        ".gel-body-copy",
+        "#story-body"
+    ),
+    "reuters.com": (
+        "[data-testid='paragraph']",
+        ".StandardArticleBody_body",
+        ".ArticleBodyWrapper",
+        ".PaywallBarrier-container"
+    ),
+    "nytimes.com": (
+        ".StoryBodyCompanionColumn",
+        "[name='articleBody']",
+        ".css-53u6y8",
+        ".story-content"
+    ),
+    "washingtonpost.com": (
+        ".article-body",
+        "[data-qa='article-body']",
+        ".paywall",
+        "#article-body"
+    ),
+    "wsj.com": (
+        ".wsj-snippet-body",
+        ".article-content",
+        "#articleBody",
+        ".snippet-promotion"
+    ),
+    "bloomberg.com": (
+        "[data-module='ArticleBody']",
+        ".body-content",
+        ".fence-body",
+        "#article-content-body"
+    ),
+    "guardian.com": (
+        ".article-body-commercial-selector",
+        ".content__article-body",
+        "#maincontent",
+        ".prose"
+    ),
+    "theguardian.com": (
+        ".article-body-commercial-selector",
+        ".content__article-body",
+        "#maincontent",
+        ".prose"
+    ),
+    "independent.co.uk": (
+        ".sc-1tw117-0",
+        "#main",
+        ".body-content",
+        ".article-body"
+    ),
+    "telegraph.co.uk": (
+        ".article-body-text",
+        "#article-body",
+        ".story-body",
+        ".article-content"
+    ),
+    "ap.org": (
+        ".Article",
+        "[data-key='article']",
+        ".story-content",
+        "#article-content"
+    ),
+    "apnews.com": (
+        ".Article",
+        "[data-key='article']",
+        ".story-content",
+        "#article-content"
+    ),
+    "npr.org": (
+        "#storytext",
+        ".storytext",
+        ".story-content",
+        "#article-content"
+    ),
+    "foxnews.com": (
+        ".article-body",
+        ".article-text",
+        "#article-content",
+        ".story-content"
+    ),
+    "nbcnews.com": (
+        "[data-module='ArticleBody']",
+        ".articleBody",
+        "#article-content",
+        ".story-content"
+    ),
+    "cbsnews.com": (
+        ".content__body",
+        "#article-wrap",
+        ".story-content",
+        "#article-content"
+    ),
+    "abcnews.go.com": (".Article__Content",) + _ARTICLE_BODY_TAIL,
+    "usatoday.com": (".story-body",) + _ARTICLE_BODY_TAIL,
+    "politico.com": (".story-text",) + _ARTICLE_BODY_TAIL,
+    "huffpost.com": (".entry__text",) + _ARTICLE_BODY_TAIL,
+    "huffingtonpost.com": (".entry__text",) + _ARTICLE_BODY_TAIL,
+    "axios.com": (".gtm-story-text",) + _ARTICLE_BODY_TAIL,
+    "vox.com": (".c-entry-content",) + _ARTICLE_BODY_TAIL,
+    "buzzfeednews.com": (".news-article-header__body",) + _ARTICLE_BODY_TAIL,
+    "vice.com": (".article__body",) + _ARTICLE_BODY_TAIL,
+    "slate.com": (".article__content",) + _ARTICLE_BODY_TAIL,
+    "theatlantic.com": (
+        ".article-body",
+        "#article-content",
+        ".story-content",
+        ".c-article-body"
+    ),
+    "newyorker.com": (".SectionBreak",) + _ARTICLE_BODY_TAIL,
+    "time.com": (".padded",) + _ARTICLE_BODY_TAIL,
+    "newsweek.com": (
+        ".article-body",
+        "#article-content",
+        ".story-content",
+        ".main-article"
+    ),
+    "fortune.com": (".article-content",) + _ARTICLE_BODY_TAIL,
+    "forbes.com": (
+        ".article-body",
+        "#article-content",
+        ".story-content",
+        ".body-container"
+    ),
+    "businessinsider.com": (".content-lock-content",) + _ARTICLE_BODY_TAIL,
+    "techcrunch.com": (
+        ".article-content",
+        "#article-content",
+        ".story-content",
+        ".entry-content"
+    ),
+    "theverge.com": (".c-entry-content",) + _ARTICLE_BODY_TAIL,
+    "wired.com": (".article__chunks",) + _ARTICLE_BODY_TAIL,
+    "arstechnica.com": (".article-content",) + _POST_CONTENT_TAIL,
+    "engadget.com": (".article-text",) + _ARTICLE_BODY_TAIL,
+    "gizmodo.com": (".post-content",) + _ARTICLE_BODY_TAIL,
+    "mashable.com": (".article-content",) + _ARTICLE_BODY_TAIL,
+    "venturebeat.com": (".article-content",) + _POST_CONTENT_TAIL,
+    "zdnet.com": (".storyBody",) + _ARTICLE_BODY_TAIL,
+    "cnet.com": (".article-main-body",) + _ARTICLE_BODY_TAIL,
+    "9to5mac.com": (".post-content",) + _ARTICLE_BODY_TAIL,
+    "9to5google.com": (".post-content",) + _ARTICLE_BODY_TAIL,
+    "macrumors.com": (".article-content",) + _POST_CONTENT_TAIL,
+    "androidcentral.com": (".article-body",) + _POST_CONTENT_TAIL,
+    "imore.com": (".article-body",) + _POST_CONTENT_TAIL,
+
     # Regional/Other International Sites
-    elif "aljazeera.com" in url:
-        selectors.extend([
-            ".wysiwyg",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "rt.com" in url:
-        selectors.extend([
-            ".article__text",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "dw.com" in url:
-        selectors.extend([
-            ".longText",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "france24.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".main-content"
-        ])
-    elif "euronews.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".main-content"
-        ])
-    elif "scmp.com" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".main-content"
-        ])
-    elif "japantimes.co.jp" in url:
-        selectors.extend([
-            ".article-body",
-            "#article-content",
-            ".story-content",
-            ".main-content"
-        ])
-    elif "straitstimes.com" in url:
-        selectors.extend([
-            ".story-content",
-            "#article-content",
-            ".article-body",
-            ".main-content"
-        ])
-    elif "thestar.com.my" in url:
-        selectors.extend([
-            ".story-content",
-            "#article-content",
-            ".article-body",
-            ".main-content"
-        ])
-    elif "dawn.com" in url:
-        selectors.extend([
-            ".story__content",
-            "#article-content",
-            ".story-content",
-            ".article-body"
-        ])
-    elif "thenews.com.pk" in url:
-        selectors.extend([
-            ".story-content",
-            "#article-content",
-            ".article-body",
-            ".main-content"
-        ])
-    elif "dailystar.com.lb" in url:
-        selectors.extend([
-            ".story-content",
-            "#article-content",
-            ".article-body",
-            ".main-content"
-        ])
-    elif "arabnews.com" in url:
-        selectors.extend([
-            ".article-content",
-            "#article-content",
-            ".story-content",
-            ".main-content"
-        ])
-    
-    return selectors
+    "aljazeera.com": (".wysiwyg",) + _ARTICLE_BODY_TAIL,
+    "rt.com": (".article__text",) + _ARTICLE_BODY_TAIL,
+    "dw.com": (".longText",) + _ARTICLE_BODY_TAIL,
+    "france24.com": (".article-body",) + _STORY_MAIN_TAIL,
+    "euronews.com": (".article-body",) + _STORY_MAIN_TAIL,
+    "scmp.com": (".article-body",) + _STORY_MAIN_TAIL,
+    "japantimes.co.jp": (".article-body",) + _STORY_MAIN_TAIL,
+    "straitstimes.com": (".story-content",) + _ARTICLE_MAIN_TAIL,
+    "thestar.com.my": (".story-content",) + _ARTICLE_MAIN_TAIL,
+    "dawn.com": (".story__content",) + _ARTICLE_BODY_TAIL,
+    "thenews.com.pk": (".story-content",) + _ARTICLE_MAIN_TAIL,
+    "dailystar.com.lb": (".story-content",) + _ARTICLE_MAIN_TAIL,
+    "arabnews.com": (".article-content",) + _STORY_MAIN_TAIL
+})
+
+_TITLE_SELECTORS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    # Indian News Sites
+    "hindustantimes.com": (".headline", ".story-headline", ".main-heading"),
+    "timesofindia.indiatimes.com": (".HNMDR", "._2ssWP", ".headline"),
+    "indianexpress.com": (".native_story_title", ".story-title", ".headline"),
+    "ndtv.com": (".sp-ttl", ".story__headline", ".headline"),
+    "news18.com": (".article-heading", ".story-headline"),
+    "thehindu.com": (".title", ".story-headline", ".article-headline"),
+    "economictimes.indiatimes.com": (".artTitle", ".headline", "h1.title"),
+    "livemint.com": (".headline", ".story-headline", ".main-title"),
+    "businesstoday.in": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "financialexpress.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "moneycontrol.com": (".article_title",) + _MAIN_TITLE_TAIL,
+    "business-standard.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "scroll.in": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "thewire.in": (".td-post-title",) + _MAIN_TITLE_TAIL,
+    "newslaundry.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "caravanmagazine.in": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "outlookindia.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "india.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "firstpost.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "news.abplive.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "aajtak.in": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "republicworld.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+    "timesnownews.com": (".story-headline",) + _MAIN_TITLE_TAIL,
+
+    # International News Sites
+    "cnn.com": (".headline__text", ".pg-headline", ".cd__headline"),
+    "bbc.com": (".story-headline", ".gel-trafalgar-bold", "#main-heading"),
+    "bbc.co.uk": (".story-headline", ".gel-trafalgar-bold", "#main-heading"),
+    "reuters.com": (".ArticleHeader_headline", "[data-testid='Headline']"),
+    "nytimes.com": (".css-fwqvlz", "[data-testid='headline']", ".story-headline"),
+    "washingtonpost.com": (".headline", "[data-qa='headline']", ".article-headline"),
+    "wsj.com": (".wsj-article-headline",) + _ARTICLE_HEADLINE_TAIL,
+    "bloomberg.com": (".lede-text-only__headline", "[data-module='Headline']"),
+    "guardian.com": (".content__headline",) + _ARTICLE_HEADLINE_TAIL,
+    "theguardian.com": (".content__headline",) + _ARTICLE_HEADLINE_TAIL,
+    "independent.co.uk": (".sc-1effbv5-0",) + _ARTICLE_HEADLINE_TAIL,
+    "telegraph.co.uk": (".headline", ".article-headline", ".story-headline"),
+    "ap.org": (".Component-headline-0-2-89",) + _ARTICLE_HEADLINE_TAIL,
+    "apnews.com": (".Component-headline-0-2-89",) + _ARTICLE_HEADLINE_TAIL,
+    "npr.org": (".storytitle",) + _ARTICLE_HEADLINE_TAIL,
+    "foxnews.com": (".headline", ".article-headline", ".story-headline"),
+    "nbcnews.com": (".articleTitle",) + _ARTICLE_HEADLINE_TAIL,
+    "cbsnews.com": (".content__title",) + _ARTICLE_HEADLINE_TAIL,
+    "abcnews.go.com": (".Article__Headline",) + _ARTICLE_HEADLINE_TAIL,
+    "usatoday.com": (".asset-headline",) + _ARTICLE_HEADLINE_TAIL,
+    "politico.com": (".headline", ".article-headline", ".story-headline"),
+    "huffpost.com": (".headline__text",) + _ARTICLE_HEADLINE_TAIL,
+    "huffingtonpost.com": (".headline__text",) + _ARTICLE_HEADLINE_TAIL,
+    "axios.com": (".gtm-story-headline",) + _ARTICLE_HEADLINE_TAIL,
+    "vox.com": (".c-page-title",) + _ARTICLE_HEADLINE_TAIL,
+    "buzzfeednews.com": (".news-article-header__title",) + _ARTICLE_HEADLINE_TAIL,
+    "vice.com": (".article__title",) + _ARTICLE_HEADLINE_TAIL,
+    "slate.com": (".article__hed",) + _ARTICLE_HEADLINE_TAIL,
+    "theatlantic.com": (".article-header__title",) + _ARTICLE_HEADLINE_TAIL,
+    "newyorker.com": (".ArticleHeader__hed",) + _ARTICLE_HEADLINE_TAIL,
+    "time.com": (".headline", ".article-headline", ".story-headline"),
+    "newsweek.com": (".title",) + _ARTICLE_HEADLINE_TAIL,
+    "fortune.com": (".article-headline",) + _STORY_HEADLINE_TAIL,
+    "forbes.com": (".article-headline",) + _STORY_HEADLINE_TAIL,
+    "businessinsider.com": (".post-headline",) + _ARTICLE_HEADLINE_TAIL,
+    "techcrunch.com": (".article__title", ".headline", ".entry-title"),
+    "theverge.com": (".c-page-title",) + _ARTICLE_HEADLINE_TAIL,
+    "wired.com": (".ContentHeaderHed",) + _ARTICLE_HEADLINE_TAIL,
+    "arstechnica.com": (".article-title",) + _POST_TITLE_TAIL,
+    "engadget.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "gizmodo.com": (".headline", ".post-title", ".article-headline"),
+    "mashable.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "venturebeat.com": (".article-title",) + _POST_TITLE_TAIL,
+    "zdnet.com": (".storyTitle",) + _ARTICLE_HEADLINE_TAIL,
+    "cnet.com": (".article-headline",) + _STORY_HEADLINE_TAIL,
+    "9to5mac.com": (".post-title",) + _ARTICLE_HEADLINE_TAIL,
+    "9to5google.com": (".post-title",) + _ARTICLE_HEADLINE_TAIL,
+    "macrumors.com": (".article-title",) + _POST_TITLE_TAIL,
+    "androidcentral.com": (".article-title",) + _POST_TITLE_TAIL,
+    "imore.com": (".article-title",) + _POST_TITLE_TAIL,
+    "aljazeera.com": (".article-heading",) + _STORY_HEADLINE_TAIL,
+    "rt.com": (".article__heading",) + _STORY_HEADLINE_TAIL,
+    "dw.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "france24.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "euronews.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "scmp.com": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "japantimes.co.jp": (".article-title",) + _STORY_HEADLINE_TAIL,
+    "straitstimes.com": (".story-headline",) + _ARTICLE_TITLE_TAIL,
+    "thestar.com.my": (".story-headline",) + _ARTICLE_TITLE_TAIL,
+    "dawn.com": (".story__title",) + _STORY_HEADLINE_TAIL,
+    "thenews.com.pk": (".story-headline",) + _ARTICLE_TITLE_TAIL,
+    "dailystar.com.lb": (".story-headline",) + _ARTICLE_TITLE_TAIL,
+    "arabnews.com": (".article-title",) + _STORY_HEADLINE_TAIL
+})
+
+# Selector groups ("a, b, c") precomputed once per distinct selector tuple
+_CONTENT_SELECTORS_JOINED: Dict[Tuple[str, ...], str] = {
+    selectors: ", ".join(selectors) for selectors in _CONTENT_SELECTORS.values()
+}
+
+# Compile every known selector at import so no page pays the CSS-to-XPath cost
+_precompile_selectors(
+    [selector for selectors in _CONTENT_SELECTORS.values() for selector in selectors]
+    + list(_ARTICLE_SELECTORS) + list(_DIV_SELECTORS) + list(_GENERIC_TITLE_SELECTORS)
+    + [selector for _, selector in _META_DESCRIPTION_SELECTORS]
+    + ["meta[property='og:image']", "meta[name='twitter:image']", "meta[property='og:title']",
+       "script[type='application/ld+json']"]
+)
+
+@lru_cache(maxsize=4096)
+def _site_host(url: str) -> str:
+    """Get the lowercased hostname of a URL without any leading 'www.' (cached per URL)"""
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+# Query parameters that only track the click and never change the article
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid'})
+
+def normalize_article_url(url: str) -> str:
+    """Strip tracking parameters and the fragment so URL variants of one article compare equal"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+def _match_host_selectors(host: str, table: Mapping[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Find the selector entry for the most specific domain suffix of a host"""
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        selectors = table.get(".".join(parts[i:]))
+        if selectors:
+            return selectors
+    
+    return ()
+
+@lru_cache(maxsize=512)
+def _content_selectors_for_host(host: str) -> Tuple[str, ...]:
+    """Content selectors for a host (cached, crawls revisit the same few sites)"""
+    return _match_host_selectors(host, _CONTENT_SELECTORS)
+
+@lru_cache(maxsize=512)
+def _title_selectors_for_host(host: str) -> Tuple[str, ...]:
+    """Title selectors for a host (cached, crawls revisit the same few sites)"""
+    return _match_host_selectors(host, _TITLE_SELECTORS)
+
+def get_site_specific_selectors(url: str) -> List[str]:
+    """Get site-specific content selectors based on the URL"""
+    return list(_content_selectors_for_host(_site_host(url)))
+
+def get_site_specific_selectors_joined(url: str) -> str:
+    """Get site-specific content selectors as a single CSS selector group"""
+    selectors = _content_selectors_for_host(_site_host(url))
+    return _CONTENT_SELECTORS_JOINED[selectors] if selectors else ""
 
 def get_site_specific_title_selectors(url: str) -> List[str]:
     """Get site-specific title selectors based on the URL"""
-    selectors = []
-    
-    # Indian News Sites
-    if "hindustantimes.com" in url:
-        selectors.extend([".headline", ".story-headline", ".main-heading"])
-    elif "timesofindia.indiatimes.com" in url:
-        selectors.extend([".HNMDR", "._2ssWP", ".headline"])
-    elif "indianexpress.com" in url:
-        selectors.extend([".native_story_title", ".story-title", ".headline"])
-    elif "ndtv.com" in url:
-        selectors.extend([".sp-ttl", ".story__headline", ".headline"])
-    elif "news18.com" in url:
-        selectors.extend([".article-heading", ".story-headline"])
-    elif "thehindu.com" in url:
-        selectors.extend([".title", ".story-headline", ".article-headline"])
-    elif "economictimes.indiatimes.com" in url:
-        selectors.extend([".artTitle", ".headline", "h1.title"])
-    elif "livemint.com" in url:
-        selectors.extend([".headline", ".story-headline", ".main-title"])
-    elif "businesstoday.in" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "financialexpress.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "moneycontrol.com" in url:
-        selectors.extend([".article_title", ".headline", ".main-title"])
-    elif "business-standard.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "scroll.in" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "thewire.in" in url:
-        selectors.extend([".td-post-title", ".headline", ".main-title"])
-    elif "newslaundry.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "caravanmagazine.in" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "outlookindia.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "india.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "firstpost.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "news.abplive.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "aajtak.in" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "republicworld.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    elif "timesnownews.com" in url:
-        selectors.extend([".story-headline", ".headline", ".main-title"])
-    
-    # International News Sites  
-    elif "cnn.com" in url:
-        selectors.extend([".headline__text", ".pg-headline", ".cd__headline"])
-    elif "bbc.com" in url or "bbc.co.uk" in url:
-        selectors.extend([".story-headline", ".gel-trafalgar-bold", "#main-heading"])
-    elif "reuters.com" in url:
-        selectors.extend([".ArticleHeader_headline", "[data-testid='Headline']"])
-    elif "nytimes.com" in url:
-        selectors.extend([".css-fwqvlz", "[data-testid='headline']", ".story-headline"])
-    elif "washingtonpost.com" in url:
-        selectors.extend([".headline", "[data-qa='headline']", ".article-headline"])
-    elif "wsj.com" in url:
-        selectors.extend([".wsj-article-headline", ".headline", ".article-headline"])
-    elif "bloomberg.com" in url:
-        selectors.extend([".lede-text-only__headline", "[data-module='Headline']"])
-    elif "guardian.com" in url or "theguardian.com" in url:
-        selectors.extend([".content__headline", ".headline", ".article-headline"])
-    elif "independent.co.uk" in url:
-        selectors.extend([".sc-1effbv5-0", ".headline", ".article-headline"])
-    elif "telegraph.co.uk" in url:
-        selectors.extend([".headline", ".article-headline", ".story-headline"])
-    elif "ap.org" in url or "apnews.com" in url:
-        selectors.extend([".Component-headline-0-2-89", ".headline", ".article-headline"])
-    elif "npr.org" in url:
-        selectors.extend([".storytitle", ".headline", ".article-headline"])
-    elif "foxnews.com" in url:
-        selectors.extend([".headline", ".article-headline", ".story-headline"])
-    elif "nbcnews.com" in url:
-        selectors.extend([".articleTitle", ".headline", ".article-headline"])
-    elif "cbsnews.com" in url:
-        selectors.extend([".content__title", ".headline", ".article-headline"])
-    elif "abcnews.go.com" in url:
-        selectors.extend([".Article__Headline", ".headline", ".article-headline"])
-    elif "usatoday.com" in url:
-        selectors.extend([".asset-headline", ".headline", ".article-headline"])
-    elif "politico.com" in url:
-        selectors.extend([".headline", ".article-headline", ".story-headline"])
-    elif "huffpost.com" in url or "huffingtonpost.com" in url:
-        selectors.extend([".headline__text", ".headline", ".article-headline"])
-    elif "axios.com" in url:
-        selectors.extend([".gtm-story-headline", ".headline", ".article-headline"])
-    elif "vox.com" in url:
-        selectors.extend([".c-page-title", ".headline", ".article-headline"])
-    elif "buzzfeednews.com" in url:
-        selectors.extend([".news-article-header__title", ".headline", ".article-headline"])
-    elif "vice.com" in url:
-        selectors.extend([".article__title", ".headline", ".article-headline"])
-    elif "slate.com" in url:
-        selectors.extend([".article__hed", ".headline", ".article-headline"])
-    elif "theatlantic.com" in url:
-        selectors.extend([".article-header__title", ".headline", ".article-headline"])
-    elif "newyorker.com" in url:
-        selectors.extend([".ArticleHeader__hed", ".headline", ".article-headline"])
-    elif "time.com" in url:
-        selectors.extend([".headline", ".article-headline", ".story-headline"])
-    elif "newsweek.com" in url:
-        selectors.extend([".title", ".headline", ".article-headline"])
-    elif "fortune.com" in url:
-        selectors.extend([".article-headline", ".headline", ".story-headline"])
-    elif "forbes.com" in url:
-        selectors.extend([".article-headline", ".headline", ".story-headline"])
-    elif "businessinsider.com" in url:
-        selectors.extend([".post-headline", ".headline", ".article-headline"])
-    elif "techcrunch.com" in url:
-        selectors.extend([".article__title", ".headline", ".entry-title"])
-    elif "theverge.com" in url:
-        selectors.extend([".c-page-title", ".headline", ".article-headline"])
-    elif "wired.com" in url:
-        selectors.extend([".ContentHeaderHed", ".headline", ".article-headline"])
-    elif "arstechnica.com" in url:
-        selectors.extend([".article-title", ".headline", ".post-title"])
-    elif "engadget.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "gizmodo.com" in url:
-        selectors.extend([".headline", ".post-title", ".article-headline"])
-    elif "mashable.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "venturebeat.com" in url:
-        selectors.extend([".article-title", ".headline", ".post-title"])
-    elif "zdnet.com" in url:
-        selectors.extend([".storyTitle", ".headline", ".article-headline"])
-    elif "cnet.com" in url:
-        selectors.extend([".article-headline", ".headline", ".story-headline"])
-    elif "9to5mac.com" in url or "9to5google.com" in url:
-        selectors.extend([".post-title", ".headline", ".article-headline"])
-    elif "macrumors.com" in url:
-        selectors.extend([".article-title", ".headline", ".post-title"])
-    elif "androidcentral.com" in url:
-        selectors.extend([".article-title", ".headline", ".post-title"])
-    elif "imore.com" in url:
-        selectors.extend([".article-title", ".headline", ".post-title"])
-    elif "aljazeera.com" in url:
-        selectors.extend([".article-heading", ".headline", ".story-headline"])
-    elif "rt.com" in url:
-        selectors.extend([".article__heading", ".headline", ".story-headline"])
-    elif "dw.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "france24.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "euronews.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "scmp.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "japantimes.co.jp" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    elif "straitstimes.com" in url:
-        selectors.extend([".story-headline", ".headline", ".article-title"])
-    elif "thestar.com.my" in url:
-        selectors.extend([".story-headline", ".headline", ".article-title"])
-    elif "dawn.com" in url:
-        selectors.extend([".story__title", ".headline", ".story-headline"])
-    elif "thenews.com.pk" in url:
-        selectors.extend([".story-headline", ".headline", ".article-title"])
-    elif "dailystar.com.lb" in url:
-        selectors.extend([".story-headline", ".headline", ".article-title"])
-    elif "arabnews.com" in url:
-        selectors.extend([".article-title", ".headline", ".story-headline"])
-    
-    return selectors
+    return list(_title_selectors_for_host(_site_host(url)))
+
+# Common title suffixes (" - NDTV", " | Latest News", " - Videos", ...) in one
+# pattern anchored at the end of the title
+_TITLE_SUFFIX_RE = re.compile(r" [-|] (?:NDTV(?:\.com)?|Latest News|Breaking News|News|Videos?|Watch)$")
+
+# Suffixes stripped from <title> fallbacks before the generic-word check,
+# stored with their lengths so neither is rebuilt per call
+_PAGE_TITLE_SUFFIXES = tuple(
+    (suffix, len(suffix))
+    for suffix in (' - NDTV', ' | NDTV', ' - News', ' | News', ' - Latest News')
+)
+
+# Words that indicate a heading is navigation/UI rather than the main title
+_TITLE_EXCLUDE_WORDS = ('menu', 'home', 'search', 'navigation', 'subscribe', 'login', 'sign')
+
+# Common generic words that are never a usable title on their own
+_GENERIC_TITLE_WORDS = frozenset({'video', 'videos', 'news', 'breaking', 'latest', 'live', 'watch', 'photos', 'gallery'})
+
+def strip_page_title_suffix(page_title: str) -> str:
+    """Remove the first matching site suffix from a <title> text"""
+    for suffix, suffix_length in _PAGE_TITLE_SUFFIXES:
+        if page_title.endswith(suffix):
+            return page_title[:-suffix_length].strip()
+    return page_title
 
 def clean_title_suffix(title: str) -> str:
     """
@@ -1447,21 +1510,18 @@ def clean_title_suffix(title: str) -> str:
     if not title:
         return title
     
-    # Common suffixes to remove
-    suffixes = [
-        ' - NDTV', ' | NDTV', ' - NDTV.com', ' | NDTV.com',
-        ' - News', ' | News', ' - Latest News', ' | Latest News',
-        ' - Breaking News', ' | Breaking News',
-        ' - Video', ' | Video', ' - Videos', ' | Videos',
-        ' - Watch', ' | Watch'
-    ]
-    
-    for suffix in suffixes:
-        if title.endswith(suffix):
-            title = title[:-len(suffix)].strip()
-            break
-    
-    return title
+    cleaned_title, removed = _TITLE_SUFFIX_RE.subn("", title)
+    return cleaned_title.strip() if removed else title
+
+async def _wait_for_article_content(page, timeout_ms: int = CONTENT_WAIT_TIMEOUT_MS):
+    """Wait until an article container is attached, for at most timeout_ms"""
+    selector_group = get_site_specific_selectors_joined(page.url)
+    selector_group = f"{selector_group}, {_ARTICLE_SELECTORS_JOINED}" if selector_group else _ARTICLE_SELECTORS_JOINED
+    try:
+        await page.wait_for_selector(selector_group, state="attached", timeout=timeout_ms)
+    except Exception:
+        # Not every page has a known container; extraction falls back to other strategies
+        pass
 
 async def extract_article_details_playwright(url: str, page, timeout: int = 10) -> Dict:
     """
@@ -1480,8 +1540,10 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
         logger.info(f"🎭 Navigating to: {url}")
         await page.goto(url, wait_until="domcontentloaded", timeout=timeout*1000)
         
-        # Wait for page to load
-        await page.wait_for_timeout(2000)
+        # Wait for the article container to appear rather than sleeping a fixed 2s;
+        # Google News links get the same wait once they land on the article page
+        if "news.google.com" not in url:
+            await _wait_for_article_content(page)
         
         # Get the current URL (after any redirects)
         current_url = page.url
@@ -1498,45 +1560,43 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
                 if "articles/" in url:
                     # Try to find the actual URL in the redirect
                     try:
-                        # Wait a bit longer for potential redirects
-                        await page.wait_for_timeout(3000)
+                        # Wait for the client-side redirect off Google News (returns as soon as it happens)
+                        try:
+                            await page.wait_for_url(
+                                lambda page_url: "news.google.com" not in page_url,
+                                wait_until="domcontentloaded",
+                                timeout=GNEWS_REDIRECT_TIMEOUT_MS
+                            )
+                        except Exception:
+                            pass
                         
                         # Check if we were redirected to the actual article
                         final_url = page.url
                         if "news.google.com" not in final_url:
                             current_url = final_url
                             logger.info(f"✅ Auto-redirected to: {current_url}")
+                            # The redirect wait returns at DOMContentLoaded; let client-rendered articles fill in
+                            await _wait_for_article_content(page)
                         else:
                             # Method 2: Try to find article links on the page
                             logger.info("🔍 Searching for article links on Google News page...")
                             
-                            # More comprehensive selectors for Google News
-                            selectors_to_try = [
-                                "a[href*='http']:not([href*='google.com']):not([href*='youtube.com'])",
-                                "article a",
-                                "[data-n-tid] a",
-                                "h3 a",
-                                "h4 a", 
-                                ".article a",
-                                ".story a",
-                                "[role='article'] a"
-                            ]
+                            # All Google News link selectors in one round-trip, grouped per selector
+                            try:
+                                hrefs_by_selector = await page.eval_on_selector_all(
+                                    _GNEWS_LINK_SELECTORS_JOINED, _GNEWS_LINK_HREFS_JS, list(_GNEWS_LINK_SELECTORS)
+                                )
+                            except Exception as e:
+                                logger.debug(f"Google News link query failed: {e}")
+                                hrefs_by_selector = []
                             
                             article_links = []
-                            for selector in selectors_to_try:
-                                try:
-                                    elements = await page.query_selector_all(selector)
-                                    if elements:
-                                        logger.info(f"🔍 Found {len(elements)} links with selector: {selector}")
-                                        for element in elements[:15]:  # Check more links
-                                            href = await element.get_attribute('href')
-                                            if href and _is_valid_article_url(href):
-                                                article_links.append(href)
-                                        if article_links:
-                                            break
-                                except Exception as e:
-                                    logger.debug(f"Selector failed: {selector} - {e}")
-                                    continue
+                            for selector, hrefs in zip(_GNEWS_LINK_SELECTORS, hrefs_by_selector):
+                                if hrefs:
+                                    logger.info(f"🔍 Found {len(hrefs)} links with selector: {selector}")
+                                    article_links = [href for href in hrefs if href and _is_valid_article_url(href)]
+                                    if article_links:
+                                        break
                             
                             if article_links:
                                 # Navigate to the first valid article link
@@ -1544,7 +1604,11 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
                                 logger.info(f"🔗 Found valid article link: {actual_url}")
                                 
                                 await page.goto(actual_url, wait_until="domcontentloaded", timeout=timeout*1000)
-                                await page.wait_for_timeout(2000)
+                                # Settle on network idle instead of a fixed 2s sleep; quiet pages return at once
+                                try:
+                                    await page.wait_for_load_state("networkidle", timeout=CONTENT_WAIT_TIMEOUT_MS)
+                                except Exception:
+                                    pass
                                 
                                 current_url = page.url
                                 logger.info(f"✅ Successfully redirected to: {current_url}")
@@ -1578,80 +1642,55 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
                     "error": f"Redirect error: {str(e)}"
                 }
         
-        # Extract Open Graph image
-        og_image = None
-        twitter_image = None
-        
-        # Try to find Open Graph image
+        # Open Graph / Twitter card images, the page title and <img> attributes in one round-trip
         try:
-            og_element = await page.query_selector("meta[property='og:image']")
-            if og_element:
-                og_image = await og_element.get_attribute("content")
-                logger.info(f"Found OG image: {og_image}")
-        except:
-            pass
+            page_media = await page.evaluate(_PAGE_MEDIA_JS)
+        except Exception as e:
+            logger.debug(f"Page media query failed: {e}")
+            page_media = {'title': await page.title(), 'images': []}
         
-        # Try to find Twitter card image
-        try:
-            twitter_element = await page.query_selector("meta[name='twitter:image']")
-            if twitter_element:
-                twitter_image = await twitter_element.get_attribute("content")
-                logger.info(f"Found Twitter image: {twitter_image}")
-        except:
-            pass
+        og_image = page_media.get('og_image')
+        if og_image:
+            logger.info(f"Found OG image: {og_image}")
+        
+        twitter_image = page_media.get('twitter_image')
+        if twitter_image:
+            logger.info(f"Found Twitter image: {twitter_image}")
         
         # Extract the page title
-        page_title = await page.title()
+        page_title = page_media.get('title') or ""
         
         # Extract a clean article title using multiple strategies
         clean_title = await extract_clean_title(page, page_title)
         
-        # Enhanced image extraction with quality scoring
+        # Enhanced image extraction with quality scoring (only needed without a social-card image)
         best_image = None
         try:
-            img_elements = await page.query_selector_all("img")
-            image_candidates = []
+            # Keep the largest valid image (larger images generally better); the
+            # first one wins ties. Rejects are dropped as they are seen, no sort needed.
+            best_area = -1
             
-            for img in img_elements[:30]:  # Check more images
-                try:
-                    src = await img.get_attribute("src")
-                    if not src or not src.startswith(("http://", "https://")):
-                        continue
-                    
-                    # Get image attributes
-                    alt_text = await img.get_attribute("alt") or ""
-                    width = await img.get_attribute("width")
-                    height = await img.get_attribute("height")
-                    class_name = await img.get_attribute("class") or ""
-                    
-                    # Get dimensions
-                    try:
-                        w = int(width) if width else 0
-                        h = int(height) if height else 0
-                        area = w * h if w and h else 0
-                    except (ValueError, TypeError):
-                        area = 0
-                    
-                    image_candidates.append({
-                        'src': src,
-                        'area': area,
-                        'alt': alt_text,
-                        'width': w,
-                        'height': h
-                    })
-                    
-                except Exception as e:
+            for img in page_media['images']:  # Check more images
+                src = img['src']
+                if not src or not src.startswith(("http://", "https://")):
                     continue
+                
+                # Get dimensions (unparseable sizes count as unknown)
+                try:
+                    w = int(img['width']) if img['width'] else 0
+                except (ValueError, TypeError):
+                    w = 0
+                try:
+                    h = int(img['height']) if img['height'] else 0
+                except (ValueError, TypeError):
+                    h = 0
+                
+                if w * h > best_area and is_valid_news_image({'src': src, 'alt': img['alt'] or "", 'width': w, 'height': h}):
+                    best_image = src
+                    best_area = w * h
             
-            # Sort by area (larger images generally better)
-            image_candidates.sort(key=lambda x: x['area'], reverse=True)
-            
-            # Find the best valid image
-            for candidate in image_candidates:
-                if is_valid_news_image(candidate):
-                    best_image = candidate['src']
-                    logger.info(f"Selected image: {candidate['src'][:50]}...")
-                    break
+            if best_image:
+                logger.info(f"Selected image: {best_image[:50]}...")
                     
         except Exception as e:
             logger.debug(f"Error in enhanced image extraction: {e}")
@@ -1670,7 +1709,8 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
         }
     except Exception as e:
         logger.error(f"Error extracting article details from {url}: {e}")
-        logger.error(traceback.format_exc())
+        # Per-article failures are routine (timeouts, dead links); only format the stack when debugging
+        logger.debug("Extraction traceback", exc_info=True)
         return {
             "resolved_url": None,
             "image_url": "https://via.placeholder.com/300x150?text=No+Image",
@@ -1679,21 +1719,299 @@ async def extract_article_details_playwright(url: str, page, timeout: int = 10)
             "error": str(e)
         }
 
+# Shared HTTP client for the static-HTML fast path (keeps connections alive)
+_http_client = None
+
+def get_http_client():
+    """Get the shared httpx client, creating it on first use (None without httpx)"""
+    global _http_client
+    
+    if _http_client is None and httpx is not None:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            headers=STATIC_FETCH_HEADERS,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared httpx client"""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+class _StaticPage:
+    """
+    Read-only stand-in for a Playwright page over already fetched HTML.
+    
+    Provides just what extract_clean_article_content needs when lxml is
+    available: the page URL, its parsed tree (see _load_page_tree) and its
+    <title>.
+    """
+    
+    def __init__(self, url: str, tree, title: str):
+        self.url = url
+        self.tree = tree
+        self._title = title
+    
+    async def title(self) -> str:
+        return self._title
+
+def _static_meta_content(tree, selector: str) -> Optional[str]:
+    """Get the stripped content attribute of the first meta tag matching selector"""
+    matches = _css_matcher(selector)(tree)
+    content = matches[0].get("content") if matches else None
+    return content.strip() if content and content.strip() else None
+
+async def extract_article_details_static(url: str, timeout: int = 10) -> Optional[Dict]:
+    """
+    Extract article details from the server-rendered HTML, without a browser.
+    
+    Args:
+        url: URL of the article
+        timeout: Timeout in seconds for the HTTP request
+        
+    Returns:
+        Dictionary with article details in the same shape as
+        extract_article_details_playwright (an error entry for dead links and
+        non-HTML responses), or None when the page needs a browser (Google
+        News redirects, JS-rendered content, missing image or title, or
+        httpx/lxml not installed)
+    """
+    client = get_http_client()
+    if client is None or CSSSelector is None or "news.google.com" in url:
+        return None
+    
+    try:
+        # Stream so the headers can be checked before a PDF or video body is downloaded
+        async with client.stream("GET", url, timeout=timeout) as response:
+            content_type = response.headers.get("content-type", "")
+            if response.status_code in (404, 410) or (content_type and "html" not in content_type):
+                # Not an article page; a browser would not get any further
+                reason = f"HTTP {response.status_code}" if response.status_code >= 400 else content_type
+                logger.info(f"⏭️ Skipping non-article URL ({reason}): {url}")
+                return {
+                    "resolved_url": str(response.url),
+                    "image_url": "https://via.placeholder.com/300x150?text=No+Image",
+                    "title": None,
+                    "description": None,
+                    "error": f"Not an article page ({reason})"
+                }
+            
+            response.raise_for_status()
+            if not content_type:
+                return None
+            
+            await response.aread()
+        
+        tree = lxml_html.fromstring(response.text)
+    except Exception as e:
+        logger.debug(f"Static fetch failed for {url}: {e}")
+        return None
+    
+    image_url = (_static_meta_content(tree, "meta[property='og:image']") or
+                 _static_meta_content(tree, "meta[name='twitter:image']"))
+    if not image_url:
+        return None
+    
+    # Same title chain as the browser path; JSON-LD is read before scripts are stripped
+    json_ld = [script.text_content() for script in _css_matcher("script[type='application/ld+json']")(tree)]
+    _prepare_page_tree(tree)
+    page_title = (tree.findtext(".//title") or "").strip()
+    title = select_title(_tree_title_sources(tree, json_ld), page_title)
+    if title == NO_TITLE_FOUND:
+        return None
+    
+    resolved_url = str(response.url)
+    description = await extract_clean_article_content(_StaticPage(resolved_url, tree, page_title))
+    if len(description) < STATIC_MIN_CONTENT_LENGTH:
+        # Probably rendered client-side; let the browser have a go
+        return None
+    
+    logger.info(f"⚡ Extracted from static HTML: {resolved_url}")
+    return {
+        "resolved_url": resolved_url,
+        "image_url": image_url,
+        "title": title,
+        "description": description
+    }
+
+async def _block_heavy_resources(route):
+    """Abort requests the extractor never reads (media, fonts, styles, trackers)"""
+    request = route.request
+    # Subresource URLs are rarely repeated, so parse directly rather than
+    # evicting article URLs from the _site_host cache
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES or
+            _host_in(urlsplit(request.url).hostname or "", _TRACKER_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_scraping_context(browser):
+    """Create a browser context with the scraping options and resource blocking"""
+    context = await browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+    await context.route("**/*", _block_heavy_resources)
+    return context
+
+async def _reset_pooled_page(page):
+    """Drop the previous article's document, listeners and cookies from a pooled page"""
+    try:
+        await page.goto("about:blank")
+        await page.context.clear_cookies()
+    except Exception as e:
+        logger.debug(f"Could not reset pooled page: {e}")
+
+def article_time_limit(timeout: int) -> int:
+    """
+    Hard limit in seconds for one article, on top of Playwright's own timeouts.
+    
+    Covers two navigations (article and Google News fallback) plus the bounded
+    waits, so it only trips when a page or DOM call hangs outright.
+    """
+    return 2 * timeout + ARTICLE_TIME_LIMIT_SLACK_S
+
+async def run_with_page_pool(browser, items: List, handler, concurrency: int,
+                             item_timeout: Optional[float] = None, on_timeout=None) -> List:
+    """
+    Run handler(item, page) for every item, at most `concurrency` at a time.
+    
+    A fixed set of workers, each owning its own BrowserContext and page,
+    pulls items from a shared queue, so a slow site only holds up its own
+    worker. Pages are reset between items so no cookies or page state leak
+    into the next one. Results are returned in item order.
+    
+    With item_timeout set, an item that runs longer is cancelled, its result
+    becomes on_timeout(item) (None without a callback) and the worker gets a
+    fresh context, since the hung page may still be busy. A worker whose
+    context cannot be replaced stops; items no worker reached also get
+    on_timeout(item).
+    """
+    queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+    
+    results = [None] * len(items)
+    contexts = []
+    
+    async def worker(slot):
+        page = await contexts[slot].new_page()
+        while not queue.empty():
+            index, item = queue.get_nowait()
+            try:
+                results[index] = await asyncio.wait_for(handler(item, page), item_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"⏱️ Gave up on item {index + 1} after {item_timeout}s, recycling its context")
+                results[index] = on_timeout(item) if on_timeout else None
+                try:
+                    await contexts[slot].close()
+                except Exception as e:
+                    logger.debug(f"Could not close timed-out context: {e}")
+                contexts[slot] = None
+                try:
+                    contexts[slot] = await new_scraping_context(browser)
+                    page = await contexts[slot].new_page()
+                except Exception as e:
+                    # Retire this worker; the others drain the queue and the results still come back
+                    logger.warning(f"⚠️ Could not replace context for worker {slot + 1}, stopping it: {e}")
+                    return
+                continue
+            
+            await _reset_pooled_page(page)
+    
+    try:
+        for _ in range(max(1, min(concurrency, len(items)))):
+            contexts.append(await new_scraping_context(browser))
+        
+        await asyncio.gather(*(worker(slot) for slot in range(len(contexts))))
+        
+        # Only left over if every worker had to retire early
+        while not queue.empty():
+            index, item = queue.get_nowait()
+            results[index] = on_timeout(item) if on_timeout else None
+        return results
+    finally:
+        for context in contexts:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Could not close pooled context: {e}")
+
+# Keyword lists compiled into single alternations so each line or sentence
+# is scanned once by the regex engine instead of once per keyword
+
+# Patterns to remove (common website boilerplate)
+_BOILERPLATE_LINE_RE = re.compile("|".join(map(re.escape, (
+    'skip to', 'click here', 'read more', 'subscribe', 'newsletter',
+    'cookie', 'privacy policy', 'terms of service', 'advertisement',
+    'follow us', 'share this', 'related articles', 'trending now',
+    'breaking news', 'live updates', 'watch video', 'photo gallery',
+    'also read', 'you may like', 'recommended', 'sponsored content'
+))))
+
+# Indian context keywords for prioritization
+_INDIAN_CONTEXT_RE = re.compile("|".join(map(re.escape, (
+    'india', 'indian', 'bengaluru', 'bangalore', 'karnataka',
+    'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata',
+    'rupee', 'crore', 'lakh', 'pm modi', 'prime minister',
+    'government', 'parliament', 'supreme court', 'bjp', 'congress'
+))))
+
+_DIGIT_RE = re.compile(r'\d')
+
+# Characters that are neither alphanumeric (str.isalnum, so Unicode-aware) nor a space
+_SPECIAL_CHAR_RE = re.compile(r'[^\w ]|_')
+
+_SENTENCE_END_RE = re.compile(r'[.!?]')
+
+def split_into_sentences(text: str) -> List[str]:
+    """
+    Simple sentence splitting based on common sentence endings.
+    
+    A sentence ends at the first '.', '!' or '?' once it holds more than 10
+    characters, so abbreviations and decimals only split longer runs.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        sentence = text[start:match.end()].strip()
+        if len(sentence) > 10:
+            sentences.append(sentence)
+            start = match.end()
+    
+    remainder = text[start:].strip()
+    if remainder:
+        sentences.append(remainder)
+    
+    return sentences
+
+def _sentence_priority(idx: int, sentence: str, words: List[str]) -> int:
+    """Priority of a summary sentence at position idx (higher is better)"""
+    priority = 0
+    
+    # Prioritize sentences with Indian context
+    if _INDIAN_CONTEXT_RE.search(sentence.lower()):
+        priority += 3
+    
+    # Prioritize sentences with numbers/dates (often important facts)
+    if _DIGIT_RE.search(sentence):
+        priority += 2
+    
+    # Prioritize sentences with proper nouns (names, places)
+    if any(word[0].isupper() and len(word) > 2 for word in words):
+        priority += 1
+    
+    # Prefer sentences from early in the text
+    return priority + max(0, 3 - (idx // 3))
+
 def generate_summary(text: str, max_words: int = 60) -> str:
     """Generate an enhanced summary with better content filtering and Indian context awareness"""
     try:
         # Enhanced text cleaning - remove navigation, ads, boilerplate
         lines = text.split('\n')
         
-        # Patterns to remove (common website boilerplate)
-        removal_patterns = [
-            'skip to', 'click here', 'read more', 'subscribe', 'newsletter',
-            'cookie', 'privacy policy', 'terms of service', 'advertisement',
-            'follow us', 'share this', 'related articles', 'trending now',
-            'breaking news', 'live updates', 'watch video', 'photo gallery',
-            'also read', 'you may like', 'recommended', 'sponsored content'
-        ]
-        
         # Filter lines more intelligently
         filtered_lines = []
         for line in lines:
@@ -1705,14 +2023,14 @@ def generate_summary(text: str, max_words: int = 60) -> str:
                 
             # Skip lines that are likely navigation/boilerplate
             line_lower = line.lower()
-            is_boilerplate = any(pattern in line_lower for pattern in removal_patterns)
+            is_boilerplate = _BOILERPLATE_LINE_RE.search(line_lower) is not None
             
             # Skip lines that are all caps (likely headers/navigation)
             if line.isupper() and len(line) > 10:
                 continue
                 
             # Skip lines with too many special characters (likely ads/formatting)
-            special_char_ratio = sum(1 for c in line if not c.isalnum() and c != ' ') / len(line)
+            special_char_ratio = len(_SPECIAL_CHAR_RE.findall(line)) / len(line)
             if special_char_ratio > 0.3:
                 continue
             
@@ -1723,101 +2041,43 @@ def generate_summary(text: str, max_words: int = 60) -> str:
         # Join the filtered lines
         cleaned_text = ' '.join(filtered_lines)
         
-        # Simple sentence splitting based on common sentence endings
-        def split_into_sentences(text):
-            sentences = []
-            current = ""
-            for char in text:
-                current += char
-                if char in ['.', '!', '?'] and len(current.strip()) > 10:
-                    sentences.append(current.strip())
-                    current = ""
-            
-            if current.strip():
-                sentences.append(current.strip())
-                
-            return sentences
-        
         # Split the text into sentences
         sentences = split_into_sentences(cleaned_text)
         
-        # Indian context keywords for prioritization
-        indian_context_keywords = [
-            'india', 'indian', 'bengaluru', 'bangalore', 'karnataka',
-            'mumbai', 'delhi', 'chennai', 'hyderabad', 'pune', 'kolkata',
-            'rupee', 'crore', 'lakh', 'pm modi', 'prime minister',
-            'government', 'parliament', 'supreme court', 'bjp', 'congress'
+        # Filter and prioritize sentences (no scoring); each sentence is
+        # tokenized once and the words are reused when building the summary
+        tokenized = ((idx, sentence, sentence.split()) for idx, sentence in enumerate(sentences))
+        filtered_sentences = [
+            (idx, sentence, _sentence_priority(idx, sentence, words), words)
+            for idx, sentence, words in tokenized
+            if len(words) >= 5  # Skip very short sentences
         ]
         
-        # Filter and prioritize sentences (no scoring)
-        filtered_sentences = []
-        for sentence in sentences:
-            if len(sentence.split()) < 5:  # Skip very short sentences
-                continue
-                
-            sentence_lower = sentence.lower()
-            
-            # Prioritize sentences with Indian context
-            has_indian_context = any(keyword in sentence_lower for keyword in indian_context_keywords)
-            
-            # Prioritize sentences with numbers/dates (often important facts)
-            import re
-            has_numbers = bool(re.search(r'\d+', sentence))
-            
-            # Prioritize sentences with proper nouns (names, places)
-            words = sentence.split()
-            proper_nouns = sum(1 for word in words if word[0].isupper() and len(word) > 2)
-            has_proper_nouns = proper_nouns > 0
-            
-            # Calculate priority (higher is better)
-            priority = 0
-            if has_indian_context:
-                priority += 3
-            if has_numbers:
-                priority += 2
-            if has_proper_nouns:
-                priority += 1
-            
-            # Prefer sentences from early in the text
-            position_bonus = max(0, 3 - (sentences.index(sentence) // 3))
-            priority += position_bonus
-            
-            filtered_sentences.append((sentence, priority))
-        
         # Sort by priority (highest first)
-        filtered_sentences.sort(key=lambda x: x[1], reverse=True)
+        filtered_sentences.sort(key=lambda x: x[2], reverse=True)
         
         # Build summary from highest-priority sentences
         summary = ""
         word_count = 0
         used_sentences = []
         
-        for sentence, priority in filtered_sentences:
-            words = sentence.split()
+        for idx, sentence, priority, words in filtered_sentences:
             if word_count + len(words) <= max_words:
-                used_sentences.append(sentence)
+                used_sentences.append((idx, sentence))
                 word_count += len(words)
             elif word_count < max_words * 0.8:  # If we haven't used 80% of words, try partial
                 remaining_words = max_words - word_count
                 if remaining_words > 5:  # Only if we can add meaningful content
                     partial_sentence = " ".join(words[:remaining_words]) + "..."
-                    used_sentences.append(partial_sentence)
+                    used_sentences.append((idx, partial_sentence))
                 break
             else:
                 break
         
         # Reorder sentences to maintain logical flow (by original position)
         if used_sentences:
-            # Sort by original position in text
-            original_order = []
-            for used_sentence in used_sentences:
-                for i, (original_sentence, _) in enumerate(filtered_sentences):
-                    if used_sentence.startswith(original_sentence[:50]):  # Match by first 50 chars
-                        original_order.append((i, used_sentence))
-                        break
-            
-            original_order.sort(key=lambda x: x[0])
-            summary = " ".join([sentence for _, sentence in original_order])
+            used_sentences.sort(key=lambda x: x[0])
+            summary = " ".join([sentence for _, sentence in used_sentences])
         
         # If no sentences were found or summary is empty, use a simple word-based approach
         if not summary:
@@ -1836,8 +2096,47 @@ def generate_summary(text: str, max_words: int = 60) -> str:
         # Don't truncate the original text, return it as-is
         return text or "No content available for summarization."
 
-async def process_single_article_playwright(article: Dict, page, timeout: int) -> Dict:
-    """Process a single article using Playwright"""
+def _article_cache_path(cache_dir: str, url: str) -> str:
+    """Cache file for a URL's extracted details"""
+    return os.path.join(cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+def load_cached_article_details(cache_dir: str, url: str) -> Optional[Dict]:
+    """
+    Get previously extracted details for a URL.
+    
+    Returns None when there is no entry, it is older than ARTICLE_CACHE_TTL_S
+    or it was written by an older extractor (ARTICLE_CACHE_VERSION).
+    """
+    path = _article_cache_path(cache_dir, url)
+    try:
+        if time.time() - os.path.getmtime(path) > ARTICLE_CACHE_TTL_S:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get('version') != ARTICLE_CACHE_VERSION or entry.get('url') != url:
+        return None
+    
+    logger.info(f"💾 Using cached details for: {url}")
+    return entry['details']
+
+def store_cached_article_details(cache_dir: str, url: str, details: Dict):
+    """Save extracted details for a URL so later runs can skip the page load"""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = _article_cache_path(cache_dir, url)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': ARTICLE_CACHE_VERSION, 'url': url, 'details': details}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache details for {url}: {e}")
+
+async def process_single_article_playwright(article: Dict, page, timeout: int,
+                                            cache_dir: Optional[str] = None) -> Dict:
+    """Process a single article using Playwright (reusing cached extractions from cache_dir)"""
     try:
         input_title = article.get('title', 'Unknown Title')
         url = article.get('link')
@@ -1855,10 +2154,23 @@ async def process_single_article_playwright(article: Dict, page, timeout: int) -
                 'error': 'No URL provided'
             }
         
-        logger.debug(f"🔄 Processing: {input_title[:50]}... - {source}")
+        # Lazy %-args: this runs for every article and debug output is normally off
+        logger.debug("🔄 Processing: %s... - %s", input_title[:50], source)
         
-        # Extract article details using Playwright
-        article_details = await extract_article_details_playwright(url, page, timeout)
+        # Cache under the normalized link so tracking-tagged variants share one entry
+        try:
+            cache_key = normalize_article_url(url)
+        except ValueError:
+            cache_key = url
+        article_details = load_cached_article_details(cache_dir, cache_key) if cache_dir else None
+        if article_details is None:
+            # Try the server-rendered HTML first; only JS-rendered pages need the browser
+            article_details = await extract_article_details_static(url, timeout)
+            if article_details is None:
+                article_details = await extract_article_details_playwright(url, page, timeout)
+            
+            if cache_dir and 'error' not in article_details and article_details.get('description'):
+                store_cached_article_details(cache_dir, cache_key, article_details)
         
         # Use the extracted title from the page, falling back to input title if needed
         final_title = article_details['title'] or input_title
@@ -1869,10 +2181,16 @@ async def process_single_article_playwright(article: Dict, page, timeout: int) -
         # Quality scoring removed - no longer needed
         
         # Generate content hash for duplicate detection
-        content_hash = hashlib.md5(article_details['description'][:200].encode()).hexdigest() if article_details['description'] else None
+        content_hash = compute_content_hash(article_details['description']) if article_details['description'] else None
         
-        # Generate key points from the description
-        key_points = generate_key_points(article_details['description'], final_title) if article_details['description'] else []
+        # Generate key points from the description in a worker thread, so the
+        # event loop keeps servicing the other pages while the text is processed
+        if article_details['description']:
+            key_points = await asyncio.get_running_loop().run_in_executor(
+                None, generate_key_points, article_details['description'], final_title
+            )
+        else:
+            key_points = []
         
         # Create Inshorts-style article with content hash and key points
         processed_article = {
@@ -1901,7 +2219,68 @@ async def process_single_article_playwright(article: Dict, page, timeout: int) -
             'error': str(e)
         }
 
-async def process_news_data_playwright(news_data: Dict, max_articles: int, timeout: int, headless: bool) -> List[Dict]:
+# Process-wide Playwright driver and browser, launched on first use
+_playwright = None
+_browser = None
+_browser_lock = None
+
+async def get_browser(headless: bool = True):
+    """
+    Get the shared Chromium instance, launching it on first use.
+    
+    Launching costs 1-2 seconds, so every batch in the process reuses one
+    browser and only opens its own contexts. Call close_browser() on exit.
+    
+    When PLAYWRIGHT_WS_ENDPOINT is set (e.g. from `playwright launch-server`),
+    the script attaches to that long-running browser instead, so repeated
+    runs skip the launch as well; closing then only disconnects.
+    """
+    global _playwright, _browser, _browser_lock
+    
+    # Created lazily so the lock binds to the running event loop
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            from playwright.async_api import async_playwright
+            
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            
+            ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+            if ws_endpoint:
+                try:
+                    _browser = await _playwright.chromium.connect(ws_endpoint)
+                    logger.info(f"🔌 Connected to running Playwright browser at {ws_endpoint}")
+                    return _browser
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not connect to {ws_endpoint}, launching a new browser: {e}")
+            
+            # headless=True runs chromium-headless-shell (the old headless mode);
+            # it starts faster than full Chromium's new headless (channel="chromium")
+            _browser = await _playwright.chromium.launch(
+                headless=headless,
+                args=BROWSER_LAUNCH_ARGS
+            )
+            logger.info("🚀 Launched shared Playwright browser")
+    
+    return _browser
+
+async def close_browser():
+    """Close the shared browser (or disconnect from a remote one) and stop the Playwright driver"""
+    global _playwright, _browser
+    
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+async def process_news_data_playwright(news_data: Dict, max_articles: int, timeout: int, headless: bool,
+                                       concurrency: int = DEFAULT_CONCURRENCY,
+                                       cache_dir: Optional[str] = None) -> List[Dict]:
     """Process news data using Playwright for better performance"""
     processed_articles = []
     
@@ -1911,7 +2290,7 @@ async def process_news_data_playwright(news_data: Dict, max_articles: int, timeo
     
     # Limit the number of articles to process
     articles_to_process = news_data['articles'][:max_articles]
-    logger.info(f"🎭 Processing {len(articles_to_process)} articles with PLAYWRIGHT")
+    logger.info(f"🎭 Processing {len(articles_to_process)} articles with PLAYWRIGHT ({concurrency} at a time)")
     
     # PERFORMANCE OPTIMIZATION: Track processing metrics
     start_time = time.time()
@@ -1919,57 +2298,68 @@ async def process_news_data_playwright(news_data: Dict, max_articles: int, timeo
     
     # Check if Playwright is available
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api
     except ImportError:
         logger.error("❌ Playwright not installed. Install with: pip install playwright && playwright install chromium")
         return processed_articles
     
-    # Use Playwright for processing
-    async with async_playwright() as p:
-        # Launch browser with optimized settings
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-extensions",
-                "--disable-popup-blocking",
-                "--disable-notifications",
-                "--disable-plugins",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding"
-            ]
-        )
+    # Reuse the process-wide browser; the page pool owns and closes its contexts
+    browser = await get_browser(headless)
+    
+    # Feeds list the same story under several tracking-tagged links; load each page once
+    numbered_articles = []
+    seen_links = set()
+    for i, article in enumerate(articles_to_process):
+        link = article.get('link')
+        if link:
+            try:
+                normalized_link = normalize_article_url(link)
+            except ValueError:
+                # Malformed link: dedup on it verbatim and let its own article fail
+                normalized_link = link
+            if normalized_link in seen_links:
+                logger.info(f"🔄 Skipping duplicate link: {article.get('title', '')[:50]}...")
+                continue
+            seen_links.add(normalized_link)
+        numbered_articles.append((i, article))
+    
+    async def process(numbered_article, page):
+        i, article = numbered_article
+        logger.info(f"📰 Article {i+1}/{len(articles_to_process)}")
+        return await process_single_article_playwright(article, page, timeout, cache_dir)
+    
+    def timed_out(numbered_article):
+        _, article = numbered_article
+        return {
+            'id': 'error',
+            'title': article.get('title', 'Unknown Title'),
+            'source': article.get('source', 'Unknown Source'),
+            'url': article.get('link') or '',
+            'image_url': 'https://via.placeholder.com/300x150?text=Error',
+            'published': article.get('published', ''),
+            'error': f"Timed out after {article_time_limit(timeout)}s"
+        }
+    
+    # Articles run concurrently; the pool size paces them instead of a per-article sleep
+    results = await run_with_page_pool(
+        browser, numbered_articles, process, concurrency,
+        item_timeout=article_time_limit(timeout), on_timeout=timed_out
+    )
+    
+    # Dedup after the fact, in input order, so the first copy of a story wins;
+    # content_hash is already on every result, so a set lookup replaces rescanning
+    seen_hashes = set()
+    for result in results:
+        if 'error' not in result and result.get('description'):
+            if result['content_hash'] in seen_hashes:
+                logger.info(f"🔄 Skipping duplicate content: {result['title'][:50]}...")
+                continue
+            seen_hashes.add(result['content_hash'])
         
-        # Create a new page
-        page = await browser.new_page()
-        await page.set_viewport_size({"width": 1280, "height": 720})
+        processed_articles.append(result)
         
-        try:
-            for i, article in enumerate(articles_to_process):
-                logger.info(f"📰 Article {i+1}/{len(articles_to_process)}")
-                
-                result = await process_single_article_playwright(article, page, timeout)
-                
-                # Check for duplicate content before adding
-                if 'error' not in result and result.get('description'):
-                    if is_duplicate_content(result['description'], processed_articles):
-                        logger.info(f"🔄 Skipping duplicate content: {result['title'][:50]}...")
-                        continue
-                
-                processed_articles.append(result)
-                
-                if 'error' not in result:
-                    successful_articles += 1
-                
-                # Small delay between articles
-                if i < len(articles_to_process) - 1:
-                    await asyncio.sleep(0.3)  # Faster than Selenium
-        
-        finally:
-            await page.close()
-            await browser.close()
+        if 'error' not in result:
+            successful_articles += 1
     
     # PERFORMANCE METRICS
     total_time = time.time() - start_time
@@ -1985,6 +2375,14 @@ async def process_news_data_playwright(news_data: Dict, max_articles: int, timeo
 
 # Image quality scoring removed - no longer needed
 
+# Substrings of an image src/alt that mark it as a non-news image
+_IMAGE_REJECT_RE = re.compile("|".join((
+    'logo', 'icon', 'avatar', 'profile', 'thumbnail',
+    'ad', 'banner', 'sponsor', 'widget', 'button',
+    'social', 'facebook', 'twitter', 'instagram',
+    'placeholder', 'default', 'blank', 'spacer'
+)))
+
 def is_valid_news_image(image_candidate: dict) -> bool:
     """Validate if an image is suitable for news articles"""
     src = image_candidate['src'].lower()
@@ -1993,16 +2391,8 @@ def is_valid_news_image(image_candidate: dict) -> bool:
     height = image_candidate['height']
     
     # Reject obvious non-news images
-    reject_patterns = [
-        'logo', 'icon', 'avatar', 'profile', 'thumbnail',
-        'ad', 'banner', 'sponsor', 'widget', 'button',
-        'social', 'facebook', 'twitter', 'instagram',
-        'placeholder', 'default', 'blank', 'spacer'
-    ]
-    
-    for pattern in reject_patterns:
-        if pattern in src or pattern in alt:
-            return False
+    if _IMAGE_REJECT_RE.search(src) or _IMAGE_REJECT_RE.search(alt):
+        return False
     
     # Require minimum dimensions
     if width and height:
@@ -2019,70 +2409,91 @@ def is_valid_news_image(image_candidate: dict) -> bool:
     
     return True
 
+# Boilerplate phrases that disqualify a summary
+_BOILERPLATE_PHRASE_RE = re.compile("|".join(map(re.escape, (
+    'click here', 'read more', 'subscribe', 'follow us',
+    'terms of service', 'privacy policy', 'cookie policy'
+))))
+
+# Common words ignored when comparing a summary against its title
+_COMMON_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'})
+
 def validate_summary_quality(summary: str, title: str) -> bool:
     """Validate if the generated summary meets quality standards"""
     if not summary or len(summary.strip()) < 20:
         return False
     
-    # Check if summary contains key elements from title
-    title_words = set(title.lower().split())
-    summary_words = set(summary.lower().split())
+    # Check for common boilerplate phrases (cheaper than the overlap check)
+    summary_lower = summary.lower()
+    if _BOILERPLATE_PHRASE_RE.search(summary_lower):
+        return False
     
     # At least 20% overlap with title words (excluding common words)
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'}
-    title_meaningful = title_words - common_words
-    summary_meaningful = summary_words - common_words
-    
+    title_meaningful = set(title.lower().split()) - _COMMON_WORDS
     if title_meaningful:
-        overlap = len(title_meaningful.intersection(summary_meaningful))
+        overlap = len(title_meaningful.intersection(summary_lower.split()))
         overlap_ratio = overlap / len(title_meaningful)
         if overlap_ratio < 0.2:  # Less than 20% overlap
             return False
     
-    # Check for common boilerplate phrases
-    boilerplate_phrases = [
-        'click here', 'read more', 'subscribe', 'follow us',
-        'terms of service', 'privacy policy', 'cookie policy'
-    ]
-    
-    summary_lower = summary.lower()
-    for phrase in boilerplate_phrases:
-        if phrase in summary_lower:
-            return False
-    
     return True
 
 # Content quality scoring removed - no longer needed
 
+_TRUSTED_SOURCES = (
+    'reuters', 'bbc', 'cnn', 'ap news', 'npr', 'bloomberg',
+    'times of india', 'hindustan times', 'indian express',
+    'ndtv', 'news18', 'zee news', 'deccan herald', 'the hindu',
+    'economic times', 'business standard', 'mint', 'livemint'
+)
+
+@lru_cache(maxsize=1024)
 def is_trusted_source(source: str) -> bool:
-    """Check if the source is from a trusted news organization."""
+    """Check if the source is from a trusted news organization (cached, feeds repeat a few sources)."""
     if not source:
         return False
     
-    trusted_sources = [
-        'reuters', 'bbc', 'cnn', 'ap news', 'npr', 'bloomberg',
-        'times of india', 'hindustan times', 'indian express', 
-        'ndtv', 'news18', 'zee news', 'deccan herald', 'the hindu',
-        'economic times', 'business standard', 'mint', 'livemint'
-    ]
-    
     source_lower = source.lower()
-    return any(trusted in source_lower for trusted in trusted_sources)
+    return any(trusted in source_lower for trusted in _TRUSTED_SOURCES)
 
 def generate_article_id(url: str, title: str, source: str) -> str:
     """Generate a unique ID for an article (same as Selenium version)"""
+    # Stays MD5: these IDs are stored in Supabase and must match earlier runs
     combined = f"{url}|{title}|{source}"
     hash_obj = hashlib.md5(combined.encode())
     return hash_obj.hexdigest()
 
+def build_output_data(source_file: str, processed_articles: List[Dict]) -> Dict:
+    """Wrap processed articles with the metadata block written to inshorts files"""
+    return {
+        'metadata': {
+            'source_file': source_file,
+            'generation_time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'total_articles': len(processed_articles),
+            'browser_engine': 'Playwright',
+            'performance_benefits': [
+                'faster_startup',
+                'better_resource_management',
+                'more_efficient_processing'
+            ]
+        },
+        'articles': processed_articles
+    }
+
 def save_to_json(data: Dict, output_path: str):
     """Save Inshorts-style summaries to a JSON file"""
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
     
-    # Save data to JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated file
+    tmp_path = output_path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
     
     logger.info(f"Inshorts-style summaries saved to {output_path}")
     logger.info(f"Processed {len(data['articles'])} articles")
@@ -2100,27 +2511,13 @@ async def main():
             news_data, 
             args.max_articles, 
             args.timeout,
-            args.headless
+            args.headless,
+            args.concurrency,
+            args.cache_dir
         )
         
-        # Prepare output data
-        output_data = {
-            'metadata': {
-                'source_file': args.input,
-                'generation_time': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_articles': len(processed_articles),
-                'browser_engine': 'Playwright',
-                'performance_benefits': [
-                    'faster_startup',
-                    'better_resource_management',
-                    'more_efficient_processing'
-                ]
-            },
-            'articles': processed_articles
-        }
-        
         # Save to JSON file
-        save_to_json(output_data, args.output)
+        save_to_json(build_output_data(args.input, processed_articles), args.output)
         
         return 0
         
@@ -2128,6 +2525,19 @@ async def main():
         logger.error(f"Error: {str(e)}")
         logger.error(traceback.format_exc())
         return 1
+    finally:
+        await close_http_client()
+        await close_browser()
+
+def install_fast_event_loop():
+    """Use uvloop's libuv-based event loop when it is installed (Linux/macOS only)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    uvloop.install()
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
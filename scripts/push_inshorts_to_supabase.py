@@ -6,14 +6,20 @@ This script reads all inshorts_*.json files and uploads them to Supabase.
 
 import os
 import json
-import glob
 import asyncio
 import logging
+import re
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Inshorts files are parsed with the stdlib json module instead
+    orjson = None
+
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -26,11 +32,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Category uploads allowed in flight at once
+UPLOAD_CONCURRENCY = 4
+
+# Stand-in images the generator writes when no real image was found or extraction failed
+PLACEHOLDER_IMAGES = frozenset({
+    "https://via.placeholder.com/300x150?text=No+Image",
+    "https://via.placeholder.com/300x150?text=No+URL",
+    "https://via.placeholder.com/300x150?text=Error",
+    "https://via.placeholder.com/300x150?text=Google+News+Error",
+    "https://via.placeholder.com/300x150?text=Google+News+Redirect+Failed",
+    "https://via.placeholder.com/300x150?text=Redirect+Error",
+})
+
 def load_inshorts_file(file_path: str) -> Dict:
     """Load inshorts data from a JSON file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logger.info(f"Loaded {len(data.get('articles', []))} articles from {file_path}")
         return data
     except Exception as e:
@@ -46,24 +69,22 @@ def convert_inshorts_to_supabase_format(inshorts_data: Dict, category: str) -> L
         return articles
     
     for article in inshorts_data['articles']:
-        title = article.get("title", "").strip()
-        summary = article.get("summary", "").strip()
-        image_url = article.get("image_url", "").strip() if article.get("image_url") else ""
+        # Validation: Skip articles with missing essential fields. The image is
+        # checked first since it is by far the most common reason to skip
+        image_url = (article.get("image_url") or "").strip()
+        if not image_url or image_url in PLACEHOLDER_IMAGES:
+            logger.warning(f"   ⚠️  Skipping article: Missing or placeholder image - {(article.get('title') or '')[:50]}...")
+            skipped_count += 1
+            continue
         
-        # Validation: Skip articles with missing essential fields
+        title = (article.get("title") or "").strip()
         if not title:
             logger.warning(f"   ⚠️  Skipping article: Missing title")
             skipped_count += 1
             continue
-            
-            
-        if not image_url or image_url == "https://via.placeholder.com/300x150?text=No+Image":
-            logger.warning(f"   ⚠️  Skipping article: Missing or placeholder image - {title[:50]}...")
-            skipped_count += 1
-            continue
         
         # Use description field (which contains the rich article content)
-        description_content = article.get("description", "").strip()
+        description_content = (article.get("description") or "").strip()
         
         # Get key_points and ensure it's properly formatted for text[] column
         key_points = article.get("key_points", [])
@@ -94,15 +115,73 @@ def convert_inshorts_to_supabase_format(inshorts_data: Dict, category: str) -> L
     
     return articles
 
+_INSHORTS_FILENAME_RE = re.compile(r'^inshorts_(.+)\.json$')
+
 def get_category_from_filename(filename: str) -> str:
     """Extract category name from inshorts filename"""
-    # Remove 'inshorts_' prefix and '.json' suffix
-    category = filename.replace('inshorts_', '').replace('.json', '')
-    return category
+    # Strip the 'inshorts_' prefix and '.json' suffix
+    match = _INSHORTS_FILENAME_RE.match(filename)
+    return match.group(1) if match else filename
 
 
 
 
+async def upload_inshorts_file(file_path: str, semaphore: asyncio.Semaphore) -> Optional[Tuple[str, Dict]]:
+    """Load, validate and upload one inshorts file; returns (source category, store result) or None if nothing was uploaded"""
+    # Extract the filename from the full path
+    filename = os.path.basename(file_path)
+    # Get the original source category from the filename
+    source_category = get_category_from_filename(filename)
+    
+    # Map to the final, clean category for Supabase
+    final_category = map_source_to_final_category(source_category)
+    
+    logger.info(f"\n📰 Processing source category: {source_category} -> Mapped to: {final_category}")
+    logger.info(f"   File: {filename}")
+    
+    # Load the inshorts data
+    inshorts_data = load_inshorts_file(file_path)
+    
+    if not inshorts_data or 'articles' not in inshorts_data:
+        logger.warning(f"   ⚠️  No articles found in {filename}")
+        return None
+    
+    # Convert to Supabase format
+    supabase_articles = convert_inshorts_to_supabase_format(inshorts_data, final_category)
+    
+    if not supabase_articles:
+        logger.warning(f"   ⚠️  No valid articles to upload for {source_category} (all articles failed validation)")
+        return None
+    
+    logger.info(f"   📝 Validated and converted {len(supabase_articles)} high-quality articles for upload")
+    
+    # Show sample article info
+    if supabase_articles:
+        sample = supabase_articles[0]
+        logger.info(f"   📋 Sample: {sample.get('title', 'No title')[:50]}...")
+        image_url = sample.get('image_url') or 'No image'
+        logger.info(f"   🖼️  Image: {str(image_url)[:50]}...")
+        
+        # Debug key_points
+        key_points = sample.get('key_points', [])
+        if key_points:
+            logger.info(f"   🔑 Key Points ({len(key_points)}): {key_points[0][:50]}..." if key_points else "None")
+        else:
+            logger.info(f"   🔑 Key Points: None found")
+    
+    # Upload to Supabase
+    async with semaphore:
+        logger.info(f"   💾 Uploading {source_category} to Supabase...")
+        result = await store_news(supabase_articles, category=final_category)
+    
+    if result["success"]:
+        logger.info(f"   ✅ SUCCESS! Uploaded {result.get('stored_count', 0)} articles for {source_category}")
+    else:
+        error_msg = result.get("error", "Unknown error")
+        logger.error(f"   ❌ FAILED! Error uploading {source_category}: {error_msg}")
+    
+    return source_category, result
+
 async def push_all_inshorts_to_supabase(data_dir: str = "data") -> Dict:
     """Push all inshorts files to Supabase"""
     
@@ -110,8 +189,15 @@ async def push_all_inshorts_to_supabase(data_dir: str = "data") -> Dict:
     logger.info("=" * 60)
     
     # Find all inshorts files
-    inshorts_pattern = os.path.join(data_dir, "inshorts_*.json")
-    inshorts_files = glob.glob(inshorts_pattern)
+    try:
+        with os.scandir(data_dir) as entries:
+            inshorts_files = sorted(
+                entry.path for entry in entries
+                if entry.name.startswith("inshorts_") and entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
+        # A missing directory just has no files, as it did with glob
+        inshorts_files = []
     
     if not inshorts_files:
         logger.warning(f"No inshorts files found in {data_dir}")
@@ -130,63 +216,22 @@ async def push_all_inshorts_to_supabase(data_dir: str = "data") -> Dict:
     categories_processed = 0
     upload_results = {}
     
-    # Process each inshorts file
-    for file_path in inshorts_files:
-        # Extract the filename from the full path
-        filename = os.path.basename(file_path)
-        # Get the original source category from the filename
-        source_category = get_category_from_filename(filename)
-        
-        # Map to the final, clean category for Supabase
-        final_category = map_source_to_final_category(source_category)
-        
-        logger.info(f"\n📰 Processing source category: {source_category} -> Mapped to: {final_category}")
-        logger.info(f"   File: {filename}")
-        
-        # Load the inshorts data
-        inshorts_data = load_inshorts_file(file_path)
-        
-        if not inshorts_data or 'articles' not in inshorts_data:
-            logger.warning(f"   ⚠️  No articles found in {filename}")
-            continue
-        
-        # Convert to Supabase format
-        supabase_articles = convert_inshorts_to_supabase_format(inshorts_data, final_category)
-        
-        if not supabase_articles:
-            logger.warning(f"   ⚠️  No valid articles to upload for {source_category} (all articles failed validation)")
+    # Upload several categories at once; the semaphore keeps Supabase from being flooded
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    file_results = await asyncio.gather(*(
+        upload_inshorts_file(file_path, semaphore) for file_path in inshorts_files
+    ))
+    
+    for file_result in file_results:
+        if file_result is None:
             continue
         
-        logger.info(f"   📝 Validated and converted {len(supabase_articles)} high-quality articles for upload")
-        
-        # Show sample article info
-        if supabase_articles:
-            sample = supabase_articles[0]
-            logger.info(f"   📋 Sample: {sample.get('title', 'No title')[:50]}...")
-            image_url = sample.get('image_url') or 'No image'
-            logger.info(f"   🖼️  Image: {str(image_url)[:50]}...")
-            
-            # Debug key_points
-            key_points = sample.get('key_points', [])
-            if key_points:
-                logger.info(f"   🔑 Key Points ({len(key_points)}): {key_points[0][:50]}..." if key_points else "None")
-            else:
-                logger.info(f"   🔑 Key Points: None found")
-        
-        # Upload to Supabase
-        logger.info(f"   💾 Uploading to Supabase...")
-        result = await store_news(supabase_articles, category=final_category)
-        
+        source_category, result = file_result
         upload_results[source_category] = result
         
         if result["success"]:
-            articles_count = result.get("stored_count", 0)
-            total_articles_uploaded += articles_count
+            total_articles_uploaded += result.get("stored_count", 0)
             categories_processed += 1
-            logger.info(f"   ✅ SUCCESS! Uploaded {articles_count} articles for {source_category}")
-        else:
-            error_msg = result.get("error", "Unknown error")
-            logger.error(f"   ❌ FAILED! Error uploading {source_category}: {error_msg}")
     
     # Final summary
     logger.info("\n" + "=" * 60)